@@ -15,46 +15,37 @@ Usage:
     emailagent --help           # Show help
 """
 
+import heapq
+import logging
+import os
 import sys
+from collections import Counter
+from dataclasses import replace
 from datetime import datetime, timedelta
-from pathlib import Path
-from typing import Optional
+from functools import cached_property
+from itertools import islice
+from operator import attrgetter
+from typing import Any, Iterable, Iterator, Optional
 
 import typer
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 from rich.table import Table
+from rich.text import Text
 from rich.panel import Panel
 from rich import print as rprint
 
-from core import (
+# Only lightweight modules are imported here. Gmail/Google auth clients and
+# the job tracker (openpyxl) are imported inside the commands that use them,
+# so `--help`, `config` and `auth status` start quickly.
+from core.config import (
     Config,
     load_config,
     save_default_config,
     ensure_directories,
-    validate_config,
     get_default_config_path,
-    setup_logger,
-    get_logger,
-    get_credentials,
-    get_gmail_service,
-    check_auth_status,
-    logout as auth_logout,
-    AuthenticationError,
-    CredentialsNotFoundError,
-    GmailClient,
-    GmailAPIError,
-    should_delete_email,
-)
-
-from job_tracker import (
-    ExcelStorage,
-    create_excel_storage,
-    format_summary_table,
-    extract_email_info,
-    classify_email,
-    STATUS_HIERARCHY,
 )
+from core.logger import setup_logger, get_logger
 
 # =============================================================================
 # CLI Application Setup
@@ -77,23 +68,53 @@ app.add_typer(config_app, name="config")
 
 console = Console()
 
+# Emails processed between progress bar updates in long loops
+PROGRESS_UPDATE_EVERY = 32
+
+# Emails processed between plain-text progress lines when not on a terminal
+PLAIN_PROGRESS_EVERY = 500
+
+# Scans smaller than this classify in-process; starting workers costs more
+PROCESS_POOL_MIN_EMAILS = 1000
+
+# Emails sent to a worker process per task
+PROCESS_CHUNK_SIZE = 64
+
 
 # =============================================================================
 # Helper Functions
 # =============================================================================
 
 def get_config() -> Config:
-    """Load configuration, creating default if needed."""
+    """
+    Load configuration, creating default if needed.
+
+    load_config caches the parsed config until the file or environment
+    changes; use dataclasses.replace to derive modified copies.
+    """
     config_path = get_default_config_path()
 
     if not config_path.exists():
-        ensure_directories()
+        ensure_directories(Config())
         save_default_config(config_path)
         console.print(f"[dim]Created default config at {config_path}[/dim]")
 
     return load_config(config_path)
 
 
+class CLIState:
+    """
+    Per-invocation state shared with commands through ctx.obj.
+
+    Created by the root callback. The config is loaded on first access, so
+    --help and --version never touch the config file.
+    """
+
+    @cached_property
+    def config(self) -> Config:
+        return get_config()
+
+
 def show_error(message: str) -> None:
     """Display error message."""
     console.print(f"[red][/red] Error: {message}")
@@ -114,27 +135,131 @@ def show_info(message: str) -> None:
     console.print(f"[blue][/blue] {message}")
 
 
+_STATUS_COLORS = {
+    'Applied': 'blue',
+    'Interviewing': 'yellow',
+    'Rejected': 'red',
+    'Offer': 'green',
+}
+
+_CONFIDENCE_COLORS = {
+    'high': 'green',
+    'medium': 'yellow',
+    'low': 'red',
+}
+
+# Markup strings are built once so table rendering is a single lookup per cell
+_STATUS_MARKUP = {s: f"[{c}]{s}[/{c}]" for s, c in _STATUS_COLORS.items()}
+_CONFIDENCE_MARKUP = {s: f"[{c}]{s}[/{c}]" for s, c in _CONFIDENCE_COLORS.items()}
+
+
+def make_progress(bar: bool = True, transient: bool = False) -> Progress:
+    """
+    Create a progress display for long-running steps.
+
+    When stdout is not a terminal the display is disabled, so no refresh
+    thread runs and no escape codes end up in piped output.
+
+    Args:
+        bar: Include the bar and percentage columns.
+        transient: Remove the display when it finishes.
+    """
+    columns = [SpinnerColumn(), TextColumn("[progress.description]{task.description}")]
+    if bar:
+        columns += [BarColumn(), TaskProgressColumn()]
+
+    return Progress(
+        *columns,
+        console=console,
+        transient=transient,
+        refresh_per_second=4,
+        disable=not console.is_terminal,
+    )
+
+
+def email_to_dict(email: Any) -> dict[str, Any]:
+    """Convert a fetched Email to the dict the job tracker extracts from."""
+    return {
+        'id': email.id,
+        'subject': email.subject,
+        'from': email.sender,
+        'body': email.body,
+        'snippet': email.snippet,
+        'date': email.date,
+    }
+
+
+def scan_workers(total: int, parallel: bool, max_workers: int) -> int:
+    """
+    Number of worker processes to classify a scan of total emails with.
+
+    Args:
+        total: Emails in the scan.
+        parallel: advanced.parallel_extraction; without it nothing runs
+            in worker processes.
+        max_workers: advanced.max_workers, the most processes to start.
+
+    Returns:
+        Worker count; 1 means classify in-process.
+    """
+    if not parallel or total < PROCESS_POOL_MIN_EMAILS:
+        return 1
+    return max(1, min(max_workers, os.cpu_count() or 1))
+
+
+def classify_in_workers(emails: Iterable[Any], workers: int) -> Iterator[tuple[Any, Optional[Any]]]:
+    """
+    Pair emails with their extraction, computed in worker processes.
+
+    Extraction and classification are pure-Python regex work, so they only
+    scale across cores in separate processes. Emails are sent in windows
+    of workers * PROCESS_CHUNK_SIZE, so fetching keeps streaming.
+
+    Args:
+        emails: Fetched Email objects.
+        workers: Worker process count; 1 or less classifies nothing.
+
+    Yields:
+        (email, extraction) pairs in input order. extraction is None when
+        no worker result is available (single worker, or the window
+        failed), and the caller should run process_email() itself so
+        errors are reported per email.
+    """
+    emails = iter(emails)
+    if workers <= 1:
+        for email in emails:
+            yield email, None
+        return
+
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    from job_tracker import process_email
+
+    # Spawn rather than fork: the Gmail fetch threads are running
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        while window := list(islice(emails, workers * PROCESS_CHUNK_SIZE)):
+            try:
+                extractions = list(pool.map(
+                    process_email,
+                    [email_to_dict(email) for email in window],
+                    chunksize=PROCESS_CHUNK_SIZE,
+                ))
+            except Exception as e:
+                get_logger("cli").warning(f"Worker classification failed, retrying in-process: {e}")
+                extractions = [None] * len(window)
+
+            yield from zip(window, extractions)
+
+
 def format_status(status: str) -> str:
     """Format status with color."""
-    colors = {
-        'Applied': 'blue',
-        'Interviewing': 'yellow',
-        'Rejected': 'red',
-        'Offer': 'green',
-    }
-    color = colors.get(status, 'white')
-    return f"[{color}]{status}[/{color}]"
+    return _STATUS_MARKUP.get(status) or f"[white]{status}[/white]"
 
 
 def format_confidence(confidence: str) -> str:
     """Format confidence with color."""
-    colors = {
-        'high': 'green',
-        'medium': 'yellow',
-        'low': 'red',
-    }
-    color = colors.get(confidence, 'white')
-    return f"[{color}]{confidence}[/{color}]"
+    return _CONFIDENCE_MARKUP.get(confidence) or f"[white]{confidence}[/white]"
 
 
 # =============================================================================
@@ -143,6 +268,7 @@ def format_confidence(confidence: str) -> str:
 
 @auth_app.command("login")
 def auth_login(
+    ctx: typer.Context,
     force: bool = typer.Option(False, "--force", "-f", help="Force re-authentication"),
 ):
     """
@@ -151,10 +277,11 @@ def auth_login(
     Opens browser for Google authentication. User grants permissions
     for Gmail API access. Credentials are saved locally.
     """
-    config = get_config()
+    from core.auth import get_gmail_service, AuthenticationError, CredentialsNotFoundError
+    config = ctx.obj.config
 
-    credentials_path = Path(config.gmail.credentials_path).expanduser()
-    token_path = Path(config.gmail.token_path).expanduser()
+    credentials_path = config.gmail.credentials_path
+    token_path = config.gmail.token_path
 
     if not credentials_path.exists():
         show_error(
@@ -172,10 +299,9 @@ def auth_login(
     try:
         console.print("Opening browser for Google authentication...")
 
-        creds = get_credentials(credentials_path, token_path, force_refresh=force)
+        service = get_gmail_service(credentials_path, token_path, force_refresh=force)
 
         # Get user email from Gmail API
-        service = get_gmail_service(credentials_path, token_path)
         profile = service.users().getProfile(userId='me').execute()
         email = profile.get('emailAddress', 'unknown')
 
@@ -195,6 +321,7 @@ def auth_login(
 
 @auth_app.command("logout")
 def auth_logout_cmd(
+    ctx: typer.Context,
     revoke: bool = typer.Option(False, "--revoke", help="Revoke token with Google"),
 ):
     """
@@ -203,8 +330,9 @@ def auth_logout_cmd(
     Deletes the local token file. Use --revoke to also revoke
     the token with Google (more thorough).
     """
-    config = get_config()
-    token_path = Path(config.gmail.token_path).expanduser()
+    from core.auth import logout as auth_logout
+    config = ctx.obj.config
+    token_path = config.gmail.token_path
 
     if not token_path.exists():
         show_info("No token found. Already logged out.")
@@ -221,12 +349,13 @@ def auth_logout_cmd(
 
 
 @auth_app.command("status")
-def auth_status():
+def auth_status(ctx: typer.Context):
     """Check current authentication status."""
-    config = get_config()
+    from core.auth import check_auth_status
+    config = ctx.obj.config
 
-    credentials_path = Path(config.gmail.credentials_path).expanduser()
-    token_path = Path(config.gmail.token_path).expanduser()
+    credentials_path = config.gmail.credentials_path
+    token_path = config.gmail.token_path
 
     # Check credentials
     if not credentials_path.exists():
@@ -264,12 +393,15 @@ def auth_status():
 
 @job_app.command("scan")
 def job_scan(
+    ctx: typer.Context,
     preview: bool = typer.Option(False, "--preview", "-p", help="Preview without deleting"),
     use_ai: bool = typer.Option(False, "--use-ai", help="Enable AI extraction (Ollama)"),
     no_ai: bool = typer.Option(True, "--no-ai", help="Pattern-only mode (default)"),
     max_emails: int = typer.Option(10000, "--max-emails", "-m", help="Maximum emails to process"),
     since: Optional[str] = typer.Option(None, "--since", help="Only process emails after date (YYYY-MM-DD)"),
     confirm: bool = typer.Option(True, "--confirm-delete/--no-confirm", help="Require confirmation before delete"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Fetch every email from Gmail, bypassing the email cache"),
+    cache_ttl: Optional[int] = typer.Option(None, "--cache-ttl", help="Hours an unused cached email is kept"),
 ):
     """
     Scan Gmail for job-related emails.
@@ -282,7 +414,12 @@ def job_scan(
         emailagent job scan --use-ai     # Use AI for better accuracy
         emailagent job scan --since 2026-01-01  # Process recent emails only
     """
-    config = get_config()
+    from core.auth import get_gmail_session, AuthenticationError
+    from core.deleter import should_delete_email
+    from core.email_cache import EmailCache
+    from core.gmail_client import GmailClient, GmailAPIError
+    from job_tracker import create_excel_storage, process_email
+    config = ctx.obj.config
     setup_logger(
         level=config.logging.level,
         log_directory=config.logging.log_directory,
@@ -304,24 +441,34 @@ def job_scan(
 
     # Override AI setting
     if use_ai:
-        config.extraction.use_ai = True
+        config = replace(config, extraction=replace(config.extraction, use_ai=True))
 
     # Authenticate
     try:
-        credentials_path = Path(config.gmail.credentials_path).expanduser()
-        token_path = Path(config.gmail.token_path).expanduser()
-        creds = get_credentials(credentials_path, token_path)
-        service = get_gmail_service(credentials_path, token_path)
+        credentials_path = config.gmail.credentials_path
+        token_path = config.gmail.token_path
+        credentials, service = get_gmail_session(credentials_path, token_path)
     except AuthenticationError as e:
         show_error(f"Authentication required: {e}")
         console.print("[dim]Run 'emailagent auth login' first[/dim]")
         raise typer.Exit(2)
 
+    # Open the email content cache; it is closed when the command exits
+    cache = None
+    if config.advanced.cache_enabled and not no_cache:
+        cache = ctx.with_resource(EmailCache(
+            config.advanced.cache_directory / "emails.sqlite3",
+            ttl_hours=config.advanced.cache_ttl_hours if cache_ttl is None else cache_ttl,
+        ))
+
     # Initialize Gmail client
     gmail = GmailClient(
         service,
         batch_size=config.gmail.batch_size,
         requests_per_second=config.gmail.requests_per_second,
+        max_workers=config.advanced.max_workers,
+        cache=cache,
+        credentials=credentials,
     )
 
     # Initialize Excel storage
@@ -332,11 +479,7 @@ def job_scan(
 
     # Search for emails
     try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            transient=True,
-        ) as progress:
+        with make_progress(bar=False, transient=True) as progress:
             progress.add_task("Searching for job emails...", total=None)
             email_ids = gmail.search_job_emails(max_results=max_emails, since_date=since_date)
 
@@ -359,72 +502,51 @@ def job_scan(
         'conflicts': 0,
         'to_delete': [],
         'to_keep': [],
-        'status_counts': {s: 0 for s in STATUS_HIERARCHY},
+        'status_counts': Counter(),
     }
 
     console.print("\n[bold]Processing emails...[/bold]")
 
-    # Fetch all emails first
-    emails_data = []
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TaskProgressColumn(),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Fetching email details", total=len(email_ids))
-
-        for email in gmail.fetch_emails(email_ids):
-            emails_data.append(email)
-            progress.update(task, advance=1)
-
-    console.print(f"Fetched [bold]{len(emails_data)}[/bold] emails")
-
-    # Process emails
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TaskProgressColumn(),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Processing", total=len(emails_data))
-
-        for i, email in enumerate(emails_data):
+    # Process emails as their batches arrive, so fetching overlaps with
+    # extraction; the workbook is saved once when the batch exits
+    fetched = 0
+    statuses: list[str] = []
+    scan_logger = get_logger("scan")
+    log_emails = scan_logger.isEnabledFor(logging.INFO)
+    with storage.batch(), make_progress() as progress:
+        fetch_task = progress.add_task("Fetching email details", total=len(email_ids))
+        task = progress.add_task("Processing", total=len(email_ids))
+
+        emails = gmail.fetch_emails(
+            email_ids,
+            progress_callback=lambda done, total: progress.update(fetch_task, completed=done),
+        )
+        workers = scan_workers(
+            len(email_ids),
+            config.advanced.parallel_extraction,
+            config.advanced.max_workers,
+        )
+        classified = classify_in_workers(emails, workers)
+        for fetched, (email, extraction) in enumerate(classified, 1):
             try:
-                # Convert to dict for extraction
-                email_dict = {
-                    'id': email.id,
-                    'subject': email.subject,
-                    'from': email.sender,
-                    'body': email.body,
-                    'snippet': email.snippet,
-                    'date': email.date,
-                }
-
-                # Extract information
-                extraction = extract_email_info(
-                    email_dict,
-                    {'use_ai': config.extraction.use_ai}
-                )
-
-                # Classify status
-                extraction = classify_email(extraction, email_dict)
+                # Extract information and classify status
+                if extraction is None:
+                    extraction = process_email(email_to_dict(email))
 
                 # Log email details for debugging
-                get_logger("scan").info(
-                    f"ID: {email.id} | From: {email.sender} | "
-                    f"Subject: {email.subject[:80]} | "
-                    f"Status: {extraction.status} | Company: {extraction.company}"
-                )
+                if log_emails:
+                    scan_logger.info(
+                        "ID: %s | From: %s | Subject: %.80s | Status: %s | Company: %s",
+                        email.id, email.sender, email.subject,
+                        extraction.status, extraction.company,
+                    )
 
                 # Update Excel
                 update_result = storage.add_or_update(extraction)
 
                 # Track results
                 results['processed'] += 1
-                results['status_counts'][extraction.status] += 1
+                statuses.append(extraction.status)
 
                 if update_result.is_new_row:
                     results['new_companies'] += 1
@@ -434,33 +556,37 @@ def job_scan(
                     results['conflicts'] += 1
 
                 # Determine if should delete
-                email_text = f"{email.subject} {email.body}"
                 deletion_result = should_delete_email(
                     status=extraction.status,
-                    email_text=email_text,
+                    email_text=email.text,
+                    email_text_lower=email.text_lower,
                     is_conflict=update_result.is_conflict,
                     is_starred=email.is_starred,
                     has_attachments=email.has_attachments,
                     delete_applied=config.deletion.delete_applied,
                     delete_rejected=config.deletion.delete_rejected,
+                    scan_chars=config.deletion.safety_scan_chars,
                 )
                 if deletion_result.should_delete:
                     results['to_delete'].append(email.id)
                 else:
                     results['to_keep'].append(email.id)
 
-                # Save periodically
-                if (i + 1) % 100 == 0:
-                    storage.save_if_needed(100)
-
             except Exception as e:
                 get_logger("cli").error(f"Error processing {email.id}: {e}")
-                continue
 
-            progress.update(task, advance=1)
+            # Redraw in coarse steps; per-email updates cost more than the work
+            if fetched % PROGRESS_UPDATE_EVERY == 0:
+                progress.update(task, completed=fetched)
+            if progress.disable and fetched % PLAIN_PROGRESS_EVERY == 0:
+                console.print(f"Processed {fetched:,}/{len(email_ids):,} emails")
+
+        # Emails that failed to fetch are never processed
+        progress.update(task, total=fetched, completed=fetched)
+
+    results['status_counts'].update(statuses)
 
-    # Final save
-    storage.save()
+    console.print(f"Fetched [bold]{fetched}[/bold] emails")
 
     # Show summary
     console.print("\n")
@@ -513,24 +639,13 @@ Total emails processed: {results['processed']:,}
     # Delete emails
     console.print("\n[bold]Deleting emails...[/bold]")
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TaskProgressColumn(),
-        console=console,
-    ) as progress:
+    with make_progress() as progress:
         task = progress.add_task("Deleting", total=len(results['to_delete']))
 
-        deleted_count = 0
-        for email_id in results['to_delete']:
-            try:
-                if gmail.trash_email(email_id):
-                    deleted_count += 1
-            except Exception as e:
-                get_logger("cli").error(f"Failed to delete {email_id}: {e}")
-
-            progress.update(task, advance=1)
+        deleted_count, _ = gmail.trash_emails_batch(
+            results['to_delete'],
+            progress_callback=lambda done, total: progress.update(task, completed=done),
+        )
 
     show_success(f"Deleted {deleted_count:,} emails")
     console.print("\n[dim]Recovery options:[/dim]")
@@ -541,6 +656,7 @@ Total emails processed: {results['processed']:,}
 
 @job_app.command("list")
 def job_list(
+    ctx: typer.Context,
     status: Optional[str] = typer.Option(None, "--status", "-s", help="Filter by status"),
     company: Optional[str] = typer.Option(None, "--company", "-c", help="Filter by company (partial match)"),
     action_required: bool = typer.Option(False, "--action-required", "-a", help="Show only Interviewing/Offer"),
@@ -556,108 +672,113 @@ def job_list(
         emailagent job list --status Offer     # Filter by status
         emailagent job list --action-required  # Show actionable items
     """
-    config = get_config()
+    from job_tracker import create_excel_storage
+    config = ctx.obj.config
 
     # Initialize storage
     storage = create_excel_storage(config.to_dict())
 
     try:
-        storage.initialize()
+        storage.initialize(read_only=True)
     except FileNotFoundError:
         show_error("No job applications file found")
         console.print("[dim]Run 'emailagent job scan' to create one[/dim]")
         raise typer.Exit(4)
 
-    # Get applications
-    apps = storage.get_all_applications()
-
-    if not apps:
-        show_info("No applications found")
-        return
-
-    # Filter
-    if status:
-        apps = [a for a in apps if a.status.lower() == status.lower()]
-
-    if company:
-        company_lower = company.lower()
-        apps = [a for a in apps if company_lower in a.company.lower()]
+    # Stream rows through the filters, counting statuses for the summary
+    # in the same pass so the sheet is only read once
+    status_counts: Counter[str] = Counter()
 
-    if action_required:
-        apps = [a for a in apps if a.status in ['Interviewing', 'Offer']]
+    def matching_apps():
+        status_lower = status.lower() if status else None
+        company_lower = company.lower() if company else None
 
-    if conflicts:
-        apps = [a for a in apps if a.has_conflict]
+        for a in storage.iter_applications():
+            status_counts[a.status] += 1
 
-    # Sort by date (most recent first)
-    apps.sort(key=lambda a: a.date_last or datetime.min, reverse=True)
+            if status_lower and a.status.lower() != status_lower:
+                continue
+            if company_lower and company_lower not in a.company.lower():
+                continue
+            if action_required and a.status not in ('Interviewing', 'Offer'):
+                continue
+            if conflicts and not a.has_conflict:
+                continue
+            yield a
 
-    # Limit
-    apps = apps[:limit]
+    # Keep only the `limit` most recent matches instead of sorting everything
+    # date_last is always set (JobApplication defaults missing dates to now),
+    # so a C-level attrgetter key replaces the per-row lambda
+    apps = heapq.nlargest(limit, matching_apps(), key=attrgetter('date_last'))
 
-    if not apps:
-        show_info("No applications match filters")
+    # Machine-readable output goes straight to stdout without Rich, and an
+    # empty result is still a valid document
+    if format_ == "json":
+        import json
+        json.dump([a.to_dict() for a in apps], sys.stdout, indent=2)
+        sys.stdout.write("\n")
         return
 
-    # Output
     if format_ == "csv":
         import csv
-        import sys
         writer = csv.writer(sys.stdout)
         writer.writerow(['Company', 'Position', 'Status', 'Last Update', 'Notes'])
-        for a in apps:
-            writer.writerow([
+        writer.writerows(
+            [
                 a.company,
                 a.position,
                 a.status,
-                a.date_last.strftime('%Y-%m-%d') if a.date_last else '',
+                a.date_last.date().isoformat() if a.date_last else '',
                 a.notes,
-            ])
-
-    elif format_ == "json":
-        import json
-        data = [a.to_dict() for a in apps]
-        print(json.dumps(data, indent=2))
-
-    else:
-        # Table format
-        table = Table(title=f"Job Applications ({len(apps)} shown)")
+            ]
+            for a in apps
+        )
+        return
 
-        table.add_column("Company", style="cyan", no_wrap=True)
-        table.add_column("Position", style="white")
-        table.add_column("Status", justify="center")
-        table.add_column("Last Update", justify="center")
-        table.add_column("Notes", style="dim")
+    if not status_counts:
+        show_info("No applications found")
+        return
 
-        for a in apps:
-            status_display = format_status(a.status)
-            date_str = a.date_last.strftime('%Y-%m-%d') if a.date_last else '-'
-            notes_preview = a.notes[:30] + "..." if len(a.notes) > 30 else a.notes
+    if not apps:
+        show_info("No applications match filters")
+        return
 
+    # Table format
+    table = Table(title=f"Job Applications ({len(apps)} shown)")
+
+    table.add_column("Company", style="cyan", no_wrap=True)
+    table.add_column("Position", style="white")
+    table.add_column("Status", justify="center")
+    table.add_column("Last Update", justify="center")
+    table.add_column("Notes", style="dim")
+
+    # Cells are Text objects so Rich does not parse markup per cell
+    # (and brackets in sheet data are shown literally)
+    for a in apps:
+        date_str = a.date_last.date().isoformat() if a.date_last else '-'
+        notes_preview = a.notes[:30] + "..." if len(a.notes) > 30 else a.notes
+
+        table.add_row(
+            Text(a.company),
+            Text(a.position),
+            Text(a.status, style=_STATUS_COLORS.get(a.status, 'white')),
+            Text(date_str),
             # Highlight conflicts
-            if a.has_conflict:
-                notes_preview = f"[red]{notes_preview}[/red]"
-
-            table.add_row(
-                a.company,
-                a.position,
-                status_display,
-                date_str,
-                notes_preview,
-            )
+            Text(notes_preview, style='red' if a.has_conflict else ''),
+        )
 
-        console.print(table)
+    console.print(table)
 
-        # Summary
-        stats = storage.get_statistics()
-        console.print(f"\n[dim]Status: Applied={stats['status_counts']['Applied']} | "
-                     f"Interviewing={stats['status_counts']['Interviewing']} | "
-                     f"Rejected={stats['status_counts']['Rejected']} | "
-                     f"Offer={stats['status_counts']['Offer']}[/dim]")
+    # Summary
+    console.print(f"\n[dim]Status: Applied={status_counts['Applied']} | "
+                  f"Interviewing={status_counts['Interviewing']} | "
+                  f"Rejected={status_counts['Rejected']} | "
+                  f"Offer={status_counts['Offer']}[/dim]")
 
 
 @job_app.command("show")
 def job_show(
+    ctx: typer.Context,
     company_name: str = typer.Argument(..., help="Company name (partial match)"),
 ):
     """
@@ -666,19 +787,18 @@ def job_show(
     Example:
         emailagent job show "TechCorp"
     """
-    config = get_config()
+    from job_tracker import create_excel_storage
+    config = ctx.obj.config
     storage = create_excel_storage(config.to_dict())
 
     try:
-        storage.initialize()
+        storage.initialize(read_only=True)
     except FileNotFoundError:
         show_error("No job applications file found")
         raise typer.Exit(4)
 
     # Find company
-    apps = storage.get_all_applications()
-    company_lower = company_name.lower()
-    matches = [a for a in apps if company_lower in a.company.lower()]
+    matches = storage.find_applications(company_name)
 
     if not matches:
         show_error(f"No company found matching '{company_name}'")
@@ -713,13 +833,14 @@ def job_show(
 
 
 @job_app.command("stats")
-def job_stats():
+def job_stats(ctx: typer.Context):
     """Show application statistics and insights."""
-    config = get_config()
+    from job_tracker import create_excel_storage
+    config = ctx.obj.config
     storage = create_excel_storage(config.to_dict())
 
     try:
-        storage.initialize()
+        storage.initialize(read_only=True)
     except FileNotFoundError:
         show_error("No job applications file found")
         raise typer.Exit(4)
@@ -766,7 +887,8 @@ Total Companies: [bold]{total}[/bold]
 
 @job_app.command("export")
 def job_export(
-    format_: str = typer.Option("csv", "--format", "-f", help="Export format: csv, json"),
+    ctx: typer.Context,
+    format_: str = typer.Option("csv", "--format", "-f", help="Export format: csv, json, parquet"),
     output: Optional[str] = typer.Option(None, "--output", "-o", help="Output file path"),
     status: Optional[str] = typer.Option(None, "--status", help="Filter by status"),
 ):
@@ -776,12 +898,14 @@ def job_export(
     Examples:
         emailagent job export --format csv --output applications.csv
         emailagent job export --format json --status Offer
+        emailagent job export --format parquet   # needs pyarrow
     """
-    config = get_config()
+    from job_tracker import create_excel_storage
+    config = ctx.obj.config
     storage = create_excel_storage(config.to_dict())
 
     try:
-        storage.initialize()
+        storage.initialize(read_only=True)
     except FileNotFoundError:
         show_error("No job applications file found")
         raise typer.Exit(4)
@@ -797,6 +921,8 @@ def job_export(
             path = storage.export_to_csv(output)
         elif format_ == "json":
             path = storage.export_to_json(output)
+        elif format_ == "parquet":
+            path = storage.export_to_parquet(output)
         else:
             show_error(f"Unknown format: {format_}")
             raise typer.Exit(12)
@@ -810,6 +936,7 @@ def job_export(
 
 @job_app.command("update")
 def job_update(
+    ctx: typer.Context,
     company_name: str = typer.Argument(..., help="Company name"),
     status: Optional[str] = typer.Option(None, "--status", "-s", help="New status"),
     notes: Optional[str] = typer.Option(None, "--notes", "-n", help="Add/update notes"),
@@ -824,7 +951,8 @@ def job_update(
         emailagent job update "TechCorp" --notes "Phone screen scheduled"
         emailagent job update "TechCorp" --clear-conflict
     """
-    config = get_config()
+    from job_tracker import create_excel_storage
+    config = ctx.obj.config
     storage = create_excel_storage(config.to_dict())
 
     try:
@@ -876,26 +1004,27 @@ def job_update(
 
 
 @job_app.command("undo-last")
-def job_undo_last():
+def job_undo_last(ctx: typer.Context):
     """
     Restore emails from the last deletion batch.
 
     Moves emails back from Trash to Inbox.
     """
-    config = get_config()
+    from core.auth import get_gmail_session, AuthenticationError
+    from core.gmail_client import GmailClient
+    config = ctx.obj.config
 
     # Authenticate
     try:
-        credentials_path = Path(config.gmail.credentials_path).expanduser()
-        token_path = Path(config.gmail.token_path).expanduser()
-        creds = get_credentials(credentials_path, token_path)
-        service = get_gmail_service(credentials_path, token_path)
+        credentials_path = config.gmail.credentials_path
+        token_path = config.gmail.token_path
+        credentials, service = get_gmail_session(credentials_path, token_path)
     except AuthenticationError as e:
         show_error(f"Authentication required: {e}")
         raise typer.Exit(2)
 
     # Initialize Gmail client
-    gmail = GmailClient(service)
+    gmail = GmailClient(service, credentials=credentials)
 
     # Import deleter for undo functionality
     from core.deleter import EmailDeleter
@@ -933,31 +1062,13 @@ def job_undo_last():
     # Restore emails
     console.print("\n[bold]Restoring emails from Trash...[/bold]")
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TaskProgressColumn(),
-        console=console,
-    ) as progress:
+    with make_progress() as progress:
         task = progress.add_task("Restoring", total=len(email_ids))
 
-        restored_count = 0
-        failed = []
-
-        for email_id in email_ids:
-            try:
-                # Use Gmail API to untrash
-                service.users().messages().untrash(
-                    userId='me',
-                    id=email_id
-                ).execute()
-                restored_count += 1
-            except Exception as e:
-                get_logger("cli").error(f"Failed to restore {email_id}: {e}")
-                failed.append(email_id)
-
-            progress.update(task, advance=1)
+        restored_count, failed = gmail.untrash_emails_batch(
+            email_ids,
+            progress_callback=lambda done, total: progress.update(task, completed=done),
+        )
 
     show_success(f"Restored {restored_count} emails")
 
@@ -971,9 +1082,9 @@ def job_undo_last():
 # =============================================================================
 
 @config_app.command("show")
-def config_show():
+def config_show(ctx: typer.Context):
     """Display current configuration."""
-    config = get_config()
+    config = ctx.obj.config
 
     console.print(Panel(
         f"""[bold]Gmail:[/bold]
@@ -1004,13 +1115,14 @@ def config_show():
 
 
 @config_app.command("validate")
-def config_validate():
+def config_validate(ctx: typer.Context):
     """Validate configuration file."""
-    config = get_config()
+    from core.config import validate_config
+    config = ctx.obj.config
 
     console.print("[bold]Validating configuration...[/bold]\n")
 
-    errors, warnings = validate_config(config)
+    _, errors, warnings = validate_config(config)
 
     if not errors and not warnings:
         show_success("Configuration is valid")
@@ -1043,6 +1155,7 @@ def version_callback(value: bool):
 
 @app.callback()
 def main(
+    ctx: typer.Context,
     version: bool = typer.Option(
         None, "--version", "-v",
         callback=version_callback,
@@ -1071,6 +1184,8 @@ def main(
         import logging
         logging.getLogger().setLevel(logging.DEBUG)
 
+    ctx.obj = CLIState()
+
 
 # =============================================================================
 # Entry Point
@@ -9,75 +9,62 @@ Contains shared components used across features:
 - Configuration management
 """
 
-from .config import (
-    Config,
-    load_config,
-    save_default_config,
-    ensure_directories,
-    validate_config,
-    get_default_config_dir,
-    get_default_config_path,
-)
-from .logger import (
-    setup_logger,
-    get_logger,
-    setup_deletion_logger,
-    log_deletion,
-    log_conflict,
-    log_extraction,
-)
-from .auth import (
-    get_credentials,
-    get_gmail_service,
-    check_auth_status,
-    logout,
-    AuthenticationError,
-    CredentialsNotFoundError,
-)
-from .gmail_client import (
-    GmailClient,
-    Email,
-    GmailAPIError,
-)
-from .deleter import (
-    EmailDeleter,
-    should_delete_email,
-    contains_safety_keyword,
-    DeletionResult,
-    DeletionBatchResult,
-)
+import importlib
+from typing import Any
 
-__all__ = [
+# Public names mapped to the submodule that defines them. Submodules are
+# imported on first attribute access so importing the package stays cheap.
+_EXPORTS = {
     # Config
-    "Config",
-    "load_config",
-    "save_default_config",
-    "ensure_directories",
-    "validate_config",
-    "get_default_config_dir",
-    "get_default_config_path",
+    "Config": ".config",
+    "load_config": ".config",
+    "save_default_config": ".config",
+    "ensure_directories": ".config",
+    "validate_config": ".config",
+    "get_default_config_dir": ".config",
+    "get_default_config_path": ".config",
     # Logger
-    "setup_logger",
-    "get_logger",
-    "setup_deletion_logger",
-    "log_deletion",
-    "log_conflict",
-    "log_extraction",
+    "setup_logger": ".logger",
+    "get_logger": ".logger",
+    "setup_deletion_logger": ".logger",
+    "log_deletion": ".logger",
+    "log_conflict": ".logger",
+    "log_extraction": ".logger",
     # Auth
-    "get_credentials",
-    "get_gmail_service",
-    "check_auth_status",
-    "logout",
-    "AuthenticationError",
-    "CredentialsNotFoundError",
+    "get_credentials": ".auth",
+    "get_gmail_service": ".auth",
+    "get_gmail_session": ".auth",
+    "clear_service_cache": ".auth",
+    "check_auth_status": ".auth",
+    "logout": ".auth",
+    "AuthenticationError": ".auth",
+    "CredentialsNotFoundError": ".auth",
     # Gmail Client
-    "GmailClient",
-    "Email",
-    "GmailAPIError",
+    "GmailClient": ".gmail_client",
+    "Email": ".gmail_client",
+    "GmailAPIError": ".gmail_client",
+    # Email Cache
+    "EmailCache": ".email_cache",
     # Deleter
-    "EmailDeleter",
-    "should_delete_email",
-    "contains_safety_keyword",
-    "DeletionResult",
-    "DeletionBatchResult",
-]
+    "EmailDeleter": ".deleter",
+    "should_delete_email": ".deleter",
+    "contains_safety_keyword": ".deleter",
+    "DeletionResult": ".deleter",
+    "DeletionBatchResult": ".deleter",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
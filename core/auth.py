@@ -8,16 +8,31 @@ Handles:
 """
 
 import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Iterator, Optional
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build, Resource
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no flock
+    fcntl = None
 
 from .logger import get_logger
 
+# The Google client libraries take a few hundred milliseconds to import, so
+# they are imported where they are first needed; commands that only read
+# the cached auth status or delete the token never load them
+if TYPE_CHECKING:
+    import requests
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
+    from googleapiclient.discovery import Resource
+
 # Gmail API scopes required for the application
 # readonly: Read emails and search
 # modify: Move emails to trash
@@ -25,6 +40,26 @@ SCOPES = [
     "https://www.googleapis.com/auth/gmail.readonly",
     "https://www.googleapis.com/auth/gmail.modify",
 ]
+_REQUIRED_SCOPES = frozenset(SCOPES)
+
+
+# How long a successful check_auth_status() result is reused while
+# token.json is unchanged
+AUTH_STATUS_TTL_SECONDS = 60
+
+# Tokens this close to expiry are refreshed before use, so a token does not
+# run out part way through a scan
+REFRESH_SKEW_SECONDS = 120
+
+# How long logout waits for Google to acknowledge a token revocation
+REVOKE_TIMEOUT_SECONDS = 5
+
+# Serializes token refreshes between threads of this process
+_refresh_lock = threading.Lock()
+
+# Credentials and Gmail services built in this process, keyed by resolved
+# (credentials, token) paths
+_service_cache: dict[tuple[str, str], tuple["Credentials", "Resource"]] = {}
 
 
 class AuthenticationError(Exception):
@@ -45,11 +80,132 @@ class TokenExpiredError(AuthenticationError):
     pass
 
 
+def _load_token_info(token_path: Path) -> dict:
+    """
+    Read token.json into a dict.
+
+    Parsed contents are cached by path and modification time, so repeated
+    reads of an unchanged token skip the file read and JSON parse. The
+    returned dict is shared and must not be modified.
+
+    Args:
+        token_path: Path to token.json.
+
+    Returns:
+        Parsed authorized-user info.
+    """
+    token_path = Path(token_path)
+    return _read_token_info(str(token_path), token_path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _read_token_info(token_path: str, mtime_ns: int) -> dict:
+    """Parse token.json; mtime_ns is part of the cache key only."""
+    return json.loads(Path(token_path).read_bytes())
+
+
+@lru_cache(maxsize=1)
+def _http_session() -> "requests.Session":
+    """
+    Get the keep-alive session for token refresh and revocation, so
+    repeated refreshes reuse the TLS connection to Google's OAuth endpoint.
+    """
+    import requests
+
+    return requests.Session()
+
+
+@lru_cache(maxsize=1)
+def _auth_request() -> "Request":
+    """Get the google-auth transport request bound to _http_session()."""
+    from google.auth.transport.requests import Request
+
+    return Request(session=_http_session())
+
+
+def _load_token(token_path: Path) -> "Credentials":
+    """Load credentials from token.json."""
+    from google.oauth2.credentials import Credentials
+
+    return Credentials.from_authorized_user_info(_load_token_info(token_path), SCOPES)
+
+
+def _needs_refresh(creds: "Credentials") -> bool:
+    """Check whether a token is expired or about to expire."""
+    if creds.expired:
+        return True
+    if creds.expiry is None:
+        return False
+    # google-auth keeps expiry as a naive UTC datetime
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return (creds.expiry - now).total_seconds() < REFRESH_SKEW_SECONDS
+
+
+@contextmanager
+def _token_lock(token_path: Path) -> Iterator[None]:
+    """
+    Hold an exclusive lock for refreshing a token.
+
+    Threads are serialized with an in-process lock and processes with an
+    advisory lock on a file next to the token, where the platform has
+    flock. Refresh tokens may be rotated on use, so two concurrent
+    refreshes can leave one of them holding a revoked token.
+    """
+    with _refresh_lock:
+        if fcntl is None:
+            yield
+            return
+
+        lock_path = token_path.with_name(token_path.name + ".lock")
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(lock_path, "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _refresh_token(creds: "Credentials", token_path: Path) -> "Credentials":
+    """
+    Refresh credentials that are expired or close to expiry.
+
+    Under the token lock, token.json is read again first: if another
+    thread or process refreshed it meanwhile, its token is used instead
+    of refreshing a second time.
+
+    Args:
+        creds: Credentials loaded from token_path.
+        token_path: Path to token.json.
+
+    Returns:
+        Fresh credentials.
+    """
+    logger = get_logger("auth")
+
+    with _token_lock(token_path):
+        try:
+            latest = _load_token(token_path)
+            if not _needs_refresh(latest):
+                logger.debug("Token was refreshed by another process")
+                return latest
+            if latest.refresh_token:
+                creds = latest
+        except (OSError, ValueError):
+            pass
+
+        logger.info("Refreshing expired token...")
+        creds.refresh(_auth_request())
+        _save_token(creds, token_path)
+        logger.info("Token refreshed successfully")
+        return creds
+
+
 def get_credentials(
     credentials_path: Path,
     token_path: Path,
     force_refresh: bool = False,
-) -> Credentials:
+) -> "Credentials":
     """
     Get valid credentials for Gmail API.
 
@@ -69,7 +225,7 @@ def get_credentials(
         AuthenticationError: If authentication fails.
     """
     logger = get_logger("auth")
-    creds: Optional[Credentials] = None
+    creds: Optional["Credentials"] = None
 
     credentials_path = Path(credentials_path).expanduser()
     token_path = Path(token_path).expanduser()
@@ -85,19 +241,16 @@ def get_credentials(
     # Try to load existing token
     if not force_refresh and token_path.exists():
         try:
-            creds = Credentials.from_authorized_user_file(str(token_path), SCOPES)
+            creds = _load_token(token_path)
             logger.debug(f"Loaded token from {token_path}")
         except Exception as e:
             logger.warning(f"Failed to load token: {e}")
             creds = None
 
-    # Check if token needs refresh
-    if creds and creds.expired and creds.refresh_token:
+    # Refresh tokens that are expired or about to expire
+    if creds and creds.refresh_token and _needs_refresh(creds):
         try:
-            logger.info("Refreshing expired token...")
-            creds.refresh(Request())
-            _save_token(creds, token_path)
-            logger.info("Token refreshed successfully")
+            creds = _refresh_token(creds, token_path)
         except Exception as e:
             logger.warning(f"Token refresh failed: {e}")
             creds = None
@@ -106,6 +259,8 @@ def get_credentials(
     if not creds or not creds.valid:
         logger.info("Starting OAuth authentication flow...")
         try:
+            from google_auth_oauthlib.flow import InstalledAppFlow
+
             flow = InstalledAppFlow.from_client_secrets_file(
                 str(credentials_path), SCOPES
             )
@@ -118,26 +273,104 @@ def get_credentials(
     return creds
 
 
-def _save_token(creds: Credentials, token_path: Path) -> None:
-    """Save credentials to token file."""
+def _save_token(creds: "Credentials", token_path: Path) -> None:
+    """
+    Save credentials to token file.
+
+    The token is written to a temporary file (readable only by the owner)
+    and renamed over token.json, so a crash mid-write never leaves a
+    truncated token behind.
+    """
     logger = get_logger("auth")
     token_path = Path(token_path)
     token_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(token_path, "w") as f:
-        f.write(creds.to_json())
+    _write_private_file(token_path, creds.to_json().encode("utf-8"))
 
     logger.debug(f"Token saved to {token_path}")
 
 
+def _write_private_file(path: Path, data: bytes) -> None:
+    """
+    Atomically replace path with data, readable only by the owner.
+
+    The data is written and synced to a temporary file created with mode
+    0600 next to path, then renamed over it.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.write(fd, data)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
+def _build_service(creds: "Credentials") -> "Resource":
+    """
+    Build a Gmail API service from the discovery document bundled with the
+    client library, without fetching it or probing for a discovery cache.
+    """
+    from googleapiclient.discovery import build
+
+    return build(
+        "gmail", "v1", credentials=creds, static_discovery=True, cache_discovery=False
+    )
+
+
+def get_gmail_session(
+    credentials_path: Path,
+    token_path: Path,
+    force_refresh: bool = False,
+) -> tuple["Credentials", "Resource"]:
+    """
+    Get credentials and an authenticated Gmail API service built from them.
+
+    The credentials and service are cached per credentials/token path pair
+    for the life of the process, so repeated calls skip the token load and
+    discovery build. A cached service is reused only while its credentials
+    are not due for refresh; otherwise get_credentials() refreshes and saves
+    the token under the token lock and a new service is built.
+
+    Pass both to GmailClient so its workers can build their own HTTP
+    clients from the credentials.
+
+    Args:
+        credentials_path: Path to credentials.json.
+        token_path: Path to token.json.
+        force_refresh: Force re-authentication.
+
+    Returns:
+        Tuple of (credentials, Gmail API service resource).
+    """
+    key = (
+        str(Path(credentials_path).expanduser().resolve()),
+        str(Path(token_path).expanduser().resolve()),
+    )
+
+    cached = None if force_refresh else _service_cache.get(key)
+    if cached is not None:
+        creds, service = cached
+        if not _needs_refresh(creds):
+            return creds, service
+
+    creds = get_credentials(credentials_path, token_path, force_refresh)
+    service = _build_service(creds)
+    _service_cache[key] = (creds, service)
+    return creds, service
+
+
 def get_gmail_service(
     credentials_path: Path,
     token_path: Path,
     force_refresh: bool = False,
-) -> Resource:
+) -> "Resource":
     """
     Get authenticated Gmail API service.
 
+    Cached like get_gmail_session().
+
     Args:
         credentials_path: Path to credentials.json.
         token_path: Path to token.json.
@@ -146,15 +379,68 @@ def get_gmail_service(
     Returns:
         Gmail API service resource.
     """
-    creds = get_credentials(credentials_path, token_path, force_refresh)
-    service = build("gmail", "v1", credentials=creds)
-    return service
+    return get_gmail_session(credentials_path, token_path, force_refresh)[1]
+
+
+def clear_service_cache() -> None:
+    """Drop Gmail services cached by get_gmail_session()."""
+    _service_cache.clear()
+
+
+def _status_cache_path(token_path: Path) -> Path:
+    """Get the file that caches check_auth_status() next to the token."""
+    return token_path.with_name("auth_status.json")
+
+
+def _read_cached_status(token_path: Path, token_mtime_ns: int) -> Optional[dict]:
+    """
+    Get a cached status if it is recent and the token has not changed.
+
+    Args:
+        token_path: Path to token.json.
+        token_mtime_ns: Current modification time of token.json.
+
+    Returns:
+        Cached status dict, or None if missing or stale.
+    """
+    try:
+        cached = json.loads(_status_cache_path(token_path).read_bytes())
+    except (OSError, ValueError):
+        return None
+
+    if cached.get("token_mtime_ns") != token_mtime_ns:
+        return None
+    if time.time() - cached.get("checked_at", 0) > AUTH_STATUS_TTL_SECONDS:
+        return None
+
+    return cached.get("status")
+
+
+def _write_cached_status(token_path: Path, token_mtime_ns: int, status: dict) -> None:
+    """
+    Cache a successful status check; failures to write are ignored.
+
+    The status includes the account email address, so it is written the
+    same way as the token: owner-only and atomically.
+    """
+    try:
+        _write_private_file(_status_cache_path(token_path), json.dumps({
+            "token_mtime_ns": token_mtime_ns,
+            "checked_at": time.time(),
+            "status": status,
+        }).encode("utf-8"))
+    except OSError:
+        pass
 
 
 def check_auth_status(token_path: Path) -> dict:
     """
     Check current authentication status.
 
+    A successful result is cached on disk for AUTH_STATUS_TTL_SECONDS and
+    reused while token.json is unchanged, so repeated checks skip the
+    Gmail profile request.
+
     Args:
         token_path: Path to token.json.
 
@@ -163,20 +449,29 @@ def check_auth_status(token_path: Path) -> dict:
     """
     token_path = Path(token_path).expanduser()
 
+    try:
+        token_mtime_ns = token_path.stat().st_mtime_ns
+    except OSError:
+        token_mtime_ns = None
+
     result = {
         "authenticated": False,
         "email": None,
         "token_path": str(token_path),
-        "token_exists": token_path.exists(),
+        "token_exists": token_mtime_ns is not None,
         "token_valid": False,
         "token_expired": False,
     }
 
-    if not token_path.exists():
+    if token_mtime_ns is None:
         return result
 
+    cached = _read_cached_status(token_path, token_mtime_ns)
+    if cached is not None:
+        return cached
+
     try:
-        creds = Credentials.from_authorized_user_file(str(token_path), SCOPES)
+        creds = _load_token(token_path)
         result["token_valid"] = creds.valid
         result["token_expired"] = creds.expired
 
@@ -185,12 +480,14 @@ def check_auth_status(token_path: Path) -> dict:
 
             # Try to get email address
             if creds.expired:
-                creds.refresh(Request())
+                creds.refresh(_auth_request())
 
-            service = build("gmail", "v1", credentials=creds)
+            service = _build_service(creds)
             profile = service.users().getProfile(userId="me").execute()
             result["email"] = profile.get("emailAddress")
 
+            _write_cached_status(token_path, token_mtime_ns, result)
+
     except Exception:
         result["authenticated"] = False
 
@@ -210,6 +507,8 @@ def logout(token_path: Path, revoke: bool = False) -> bool:
     """
     logger = get_logger("auth")
     token_path = Path(token_path).expanduser()
+    clear_service_cache()
+    _status_cache_path(token_path).unlink(missing_ok=True)
 
     if not token_path.exists():
         logger.info("No token found, already logged out")
@@ -218,14 +517,14 @@ def logout(token_path: Path, revoke: bool = False) -> bool:
     # Optionally revoke token with Google
     if revoke:
         try:
-            creds = Credentials.from_authorized_user_file(str(token_path), SCOPES)
-            import requests
-
-            requests.post(
+            creds = _load_token(token_path)
+            response = _http_session().post(
                 "https://oauth2.googleapis.com/revoke",
-                params={"token": creds.token},
+                data={"token": creds.token},
                 headers={"content-type": "application/x-www-form-urlencoded"},
+                timeout=REVOKE_TIMEOUT_SECONDS,
             )
+            response.raise_for_status()
             logger.info("Token revoked with Google")
         except Exception as e:
             logger.warning(f"Failed to revoke token: {e}")
@@ -256,12 +555,7 @@ def verify_scopes(token_path: Path) -> bool:
         return False
 
     try:
-        with open(token_path, "r") as f:
-            token_data = json.load(f)
-
-        token_scopes = set(token_data.get("scopes", []))
-        required_scopes = set(SCOPES)
-
-        return required_scopes.issubset(token_scopes)
+        token_data = _load_token_info(token_path)
+        return _REQUIRED_SCOPES.issubset(token_data.get("scopes", ()))
     except Exception:
         return False
@@ -10,29 +10,49 @@ Priority: CLI flags > Environment Variables > config.yaml > defaults
 """
 
 import os
-from dataclasses import asdict, dataclass, field
+import socket
+from dataclasses import asdict, dataclass, field, fields, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional, TypeVar, get_origin
+from urllib.parse import urlparse
 
 import yaml
-from dotenv import load_dotenv
 
+# yaml.safe_load always uses the pure-Python parser; use libyaml when
+# PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML without libyaml
+    from yaml import SafeLoader as _SafeLoader
 
-# Load .env file if present
-load_dotenv()
 
+@lru_cache(maxsize=1)
+def _load_dotenv() -> None:
+    """Load a .env file into the environment, once per process."""
+    from dotenv import load_dotenv
 
+    load_dotenv()
+
+
+@lru_cache(maxsize=1)
 def get_default_config_dir() -> Path:
-    """Get the default configuration directory."""
+    """
+    Get the default configuration directory.
+
+    Cached, since every config dataclass default calls it and Path.home()
+    may fall back to a passwd lookup.
+    """
     return Path.home() / ".emailagent"
 
 
+@lru_cache(maxsize=1)
 def get_default_config_path() -> Path:
     """Get the default configuration file path."""
     return get_default_config_dir() / "config.yaml"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GmailConfig:
     """Gmail API configuration."""
 
@@ -47,7 +67,7 @@ class GmailConfig:
     requests_per_second: int = 10
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExtractionConfig:
     """Extraction configuration."""
 
@@ -58,7 +78,7 @@ class ExtractionConfig:
     ai_triggers_unclear_status: bool = True
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OllamaConfig:
     """Ollama AI configuration."""
 
@@ -69,7 +89,7 @@ class OllamaConfig:
     retry_delay: int = 5
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExcelConfig:
     """Excel storage configuration."""
 
@@ -85,7 +105,7 @@ class ExcelConfig:
     freeze_header: bool = True
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DeletionConfig:
     """Deletion configuration."""
 
@@ -93,21 +113,22 @@ class DeletionConfig:
     delete_rejected: bool = True
     delete_interviewing: bool = False
     delete_offer: bool = False
-    safety_keywords: list[str] = field(default_factory=lambda: [
+    safety_keywords: tuple[str, ...] = (
         "interview", "phone screen", "video call", "next steps", "schedule",
         "meet with", "assessment", "take-home", "offer", "compensation",
         "urgent", "deadline", "password", "account", "verify"
-    ])
+    )
     never_delete_starred: bool = True
     never_delete_with_attachments: bool = False
     never_delete_conflicts: bool = True
+    safety_scan_chars: int = 0
     minimum_age_days: int = 0
     batch_size: int = 50
     delay_between_deletes: float = 0.1
     require_confirmation: bool = True
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LoggingConfig:
     """Logging configuration."""
 
@@ -124,7 +145,7 @@ class LoggingConfig:
     log_api_calls: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CLIConfig:
     """CLI display configuration."""
 
@@ -136,7 +157,7 @@ class CLIConfig:
     items_per_page: int = 50
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AdvancedConfig:
     """Advanced configuration."""
 
@@ -150,7 +171,7 @@ class AdvancedConfig:
     max_body_length: int = 5000
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
     """Main configuration container."""
 
@@ -168,223 +189,124 @@ class Config:
         return asdict(self)
 
 
-def _expand_path(value: Any) -> Any:
-    """Expand ~ in paths."""
-    if isinstance(value, str) and value.startswith("~"):
-        return Path(value).expanduser()
-    return value
+def _expand_user(value: str) -> Path:
+    """Convert a config or environment value to a path, expanding ~."""
+    return Path(value).expanduser()
 
 
-def _get_env_value(key: str, default: Any = None) -> Optional[str]:
-    """Get value from environment variable."""
-    env_key = f"EMAILAGENT_{key.upper()}"
-    return os.environ.get(env_key, default)
+def _parse_bool(value: str) -> bool:
+    """Interpret an environment value as a boolean."""
+    return value.lower() in ("true", "1", "yes")
 
 
-def _apply_env_overrides(config: Config) -> None:
-    """Apply environment variable overrides to config."""
+# Environment variable overrides: (variable, section, field, converter)
+_ENV_OVERRIDES: tuple[tuple[str, str, str, Callable[[str], Any]], ...] = (
     # Gmail
-    if val := _get_env_value("GMAIL_CREDENTIALS"):
-        config.gmail.credentials_path = Path(val).expanduser()
-    if val := _get_env_value("GMAIL_TOKEN"):
-        config.gmail.token_path = Path(val).expanduser()
-
+    ("EMAILAGENT_GMAIL_CREDENTIALS", "gmail", "credentials_path", _expand_user),
+    ("EMAILAGENT_GMAIL_TOKEN", "gmail", "token_path", _expand_user),
     # Extraction
-    if val := _get_env_value("USE_AI"):
-        config.extraction.use_ai = val.lower() in ("true", "1", "yes")
-    if val := _get_env_value("CONFIDENCE_THRESHOLD"):
-        config.extraction.confidence_threshold = float(val)
-
+    ("EMAILAGENT_USE_AI", "extraction", "use_ai", _parse_bool),
+    ("EMAILAGENT_CONFIDENCE_THRESHOLD", "extraction", "confidence_threshold", float),
     # Ollama
-    if val := _get_env_value("OLLAMA_HOST"):
-        config.ollama.host = val
-    if val := _get_env_value("OLLAMA_MODEL"):
-        config.ollama.model = val
-
+    ("EMAILAGENT_OLLAMA_HOST", "ollama", "host", str),
+    ("EMAILAGENT_OLLAMA_MODEL", "ollama", "model", str),
     # Excel
-    if val := _get_env_value("EXCEL_PATH"):
-        config.excel.file_path = Path(val).expanduser()
-
+    ("EMAILAGENT_EXCEL_PATH", "excel", "file_path", _expand_user),
     # Logging
-    if val := _get_env_value("LOG_LEVEL"):
-        config.logging.level = val.upper()
-    if val := _get_env_value("LOG_DIR"):
-        config.logging.log_directory = Path(val).expanduser()
-
-
-def _parse_gmail_config(data: dict) -> GmailConfig:
-    """Parse Gmail configuration from dict."""
-    config = GmailConfig()
-    if "credentials_path" in data:
-        config.credentials_path = Path(data["credentials_path"]).expanduser()
-    if "token_path" in data:
-        config.token_path = Path(data["token_path"]).expanduser()
-    if "max_results_per_query" in data:
-        config.max_results_per_query = int(data["max_results_per_query"])
-    if "batch_size" in data:
-        config.batch_size = int(data["batch_size"])
-    if "requests_per_second" in data:
-        config.requests_per_second = int(data["requests_per_second"])
-    return config
+    ("EMAILAGENT_LOG_LEVEL", "logging", "level", str.upper),
+    ("EMAILAGENT_LOG_DIR", "logging", "log_directory", _expand_user),
+)
+
+
+def _apply_env_overrides(config: Config) -> Config:
+    """Apply environment variable overrides to config."""
+    overrides: dict[str, dict[str, Any]] = {}
+    for env_key, section, name, convert in _ENV_OVERRIDES:
+        if value := os.environ.get(env_key):
+            overrides.setdefault(section, {})[name] = convert(value)
+
+    return replace(config, **{
+        section: replace(getattr(config, section), **values)
+        for section, values in overrides.items()
+    })
+
+
+T = TypeVar("T")
+
+# How long validate_config waits for a TCP connection to Ollama
+OLLAMA_PROBE_TIMEOUT_SECONDS = 0.5
+
+# Converters applied to config.yaml values, by dataclass field type
+_CONVERTERS: dict[type, Callable[[Any], Any]] = {
+    bool: bool,
+    int: int,
+    float: float,
+    str: str,
+    list: list,
+    tuple: tuple,
+    Path: _expand_user,
+}
+
+
+def _parse_section(section_class: type[T], data: dict) -> T:
+    """
+    Build a config dataclass from its config.yaml section.
+
+    Each key that names a field is converted by the field's type; other
+    keys are ignored and missing fields keep their defaults.
+
+    Args:
+        section_class: Config dataclass, e.g. GmailConfig.
+        data: Mapping from config.yaml.
+
+    Returns:
+        Instance of section_class.
+    """
+    values = {}
+    for section_field in fields(section_class):
+        if section_field.name in data:
+            convert = _CONVERTERS[get_origin(section_field.type) or section_field.type]
+            values[section_field.name] = convert(data[section_field.name])
+    return section_class(**values)
 
 
 def _parse_extraction_config(data: dict) -> ExtractionConfig:
-    """Parse extraction configuration from dict."""
-    config = ExtractionConfig()
-    if "use_ai" in data:
-        config.use_ai = bool(data["use_ai"])
-    if "confidence_threshold" in data:
-        config.confidence_threshold = float(data["confidence_threshold"])
-    if "ai_triggers" in data:
-        triggers = data["ai_triggers"]
-        if "low_confidence" in triggers:
-            config.ai_triggers_low_confidence = bool(triggers["low_confidence"])
-        if "unknown_company" in triggers:
-            config.ai_triggers_unknown_company = bool(triggers["unknown_company"])
-        if "unclear_status" in triggers:
-            config.ai_triggers_unclear_status = bool(triggers["unclear_status"])
-    return config
-
-
-def _parse_ollama_config(data: dict) -> OllamaConfig:
-    """Parse Ollama configuration from dict."""
-    config = OllamaConfig()
-    if "host" in data:
-        config.host = str(data["host"])
-    if "model" in data:
-        config.model = str(data["model"])
-    if "timeout" in data:
-        config.timeout = int(data["timeout"])
-    if "max_retries" in data:
-        config.max_retries = int(data["max_retries"])
-    if "retry_delay" in data:
-        config.retry_delay = int(data["retry_delay"])
-    return config
-
-
-def _parse_excel_config(data: dict) -> ExcelConfig:
-    """Parse Excel configuration from dict."""
-    config = ExcelConfig()
-    if "file_path" in data:
-        config.file_path = Path(data["file_path"]).expanduser()
-    if "sheet_name" in data:
-        config.sheet_name = str(data["sheet_name"])
-    if "auto_backup" in data:
-        config.auto_backup = bool(data["auto_backup"])
-    if "backup_directory" in data:
-        config.backup_directory = Path(data["backup_directory"]).expanduser()
-    if "backup_retention_days" in data:
-        config.backup_retention_days = int(data["backup_retention_days"])
-    if "save_after_n_emails" in data:
-        config.save_after_n_emails = int(data["save_after_n_emails"])
-    if "use_conditional_formatting" in data:
-        config.use_conditional_formatting = bool(data["use_conditional_formatting"])
-    if "freeze_header" in data:
-        config.freeze_header = bool(data["freeze_header"])
-    return config
-
-
-def _parse_deletion_config(data: dict) -> DeletionConfig:
-    """Parse deletion configuration from dict."""
-    config = DeletionConfig()
-    if "delete_applied" in data:
-        config.delete_applied = bool(data["delete_applied"])
-    if "delete_rejected" in data:
-        config.delete_rejected = bool(data["delete_rejected"])
-    if "delete_interviewing" in data:
-        config.delete_interviewing = bool(data["delete_interviewing"])
-    if "delete_offer" in data:
-        config.delete_offer = bool(data["delete_offer"])
-    if "safety_keywords" in data:
-        config.safety_keywords = list(data["safety_keywords"])
-    if "never_delete_starred" in data:
-        config.never_delete_starred = bool(data["never_delete_starred"])
-    if "never_delete_with_attachments" in data:
-        config.never_delete_with_attachments = bool(data["never_delete_with_attachments"])
-    if "never_delete_conflicts" in data:
-        config.never_delete_conflicts = bool(data["never_delete_conflicts"])
-    if "minimum_age_days" in data:
-        config.minimum_age_days = int(data["minimum_age_days"])
-    if "batch_size" in data:
-        config.batch_size = int(data["batch_size"])
-    if "delay_between_deletes" in data:
-        config.delay_between_deletes = float(data["delay_between_deletes"])
-    if "require_confirmation" in data:
-        config.require_confirmation = bool(data["require_confirmation"])
-    return config
+    """Parse extraction configuration; ai_triggers is a nested mapping."""
+    triggers = data.get("ai_triggers") or {}
+    flat = {**data, **{f"ai_triggers_{key}": value for key, value in triggers.items()}}
+    return _parse_section(ExtractionConfig, flat)
 
 
 def _parse_logging_config(data: dict) -> LoggingConfig:
-    """Parse logging configuration from dict."""
-    config = LoggingConfig()
+    """Parse logging configuration; levels are stored upper-case."""
     if "level" in data:
-        config.level = str(data["level"]).upper()
-    if "log_directory" in data:
-        config.log_directory = Path(data["log_directory"]).expanduser()
-    if "log_file_pattern" in data:
-        config.log_file_pattern = str(data["log_file_pattern"])
-    if "max_log_size_mb" in data:
-        config.max_log_size_mb = int(data["max_log_size_mb"])
-    if "retention_days" in data:
-        config.retention_days = int(data["retention_days"])
-    if "log_extractions" in data:
-        config.log_extractions = bool(data["log_extractions"])
-    if "log_classifications" in data:
-        config.log_classifications = bool(data["log_classifications"])
-    if "log_deletions" in data:
-        config.log_deletions = bool(data["log_deletions"])
-    if "log_api_calls" in data:
-        config.log_api_calls = bool(data["log_api_calls"])
-    return config
-
-
-def _parse_cli_config(data: dict) -> CLIConfig:
-    """Parse CLI configuration from dict."""
-    config = CLIConfig()
-    if "use_colors" in data:
-        config.use_colors = bool(data["use_colors"])
-    if "show_progress" in data:
-        config.show_progress = bool(data["show_progress"])
-    if "verbose" in data:
-        config.verbose = bool(data["verbose"])
-    if "table_style" in data:
-        config.table_style = str(data["table_style"])
-    if "paginate" in data:
-        config.paginate = bool(data["paginate"])
-    if "items_per_page" in data:
-        config.items_per_page = int(data["items_per_page"])
-    return config
-
-
-def _parse_advanced_config(data: dict) -> AdvancedConfig:
-    """Parse advanced configuration from dict."""
-    config = AdvancedConfig()
-    if "parallel_extraction" in data:
-        config.parallel_extraction = bool(data["parallel_extraction"])
-    if "max_workers" in data:
-        config.max_workers = int(data["max_workers"])
-    if "cache_enabled" in data:
-        config.cache_enabled = bool(data["cache_enabled"])
-    if "cache_directory" in data:
-        config.cache_directory = Path(data["cache_directory"]).expanduser()
-    if "cache_ttl_hours" in data:
-        config.cache_ttl_hours = int(data["cache_ttl_hours"])
-    if "max_body_length" in data:
-        config.max_body_length = int(data["max_body_length"])
-    return config
+        data = {**data, "level": str(data["level"]).upper()}
+    return _parse_section(LoggingConfig, data)
+
+
+# Sections that need more than per-field conversion
+_SECTION_PARSERS: dict[str, Callable[[dict], Any]] = {
+    "extraction": _parse_extraction_config,
+    "logging": _parse_logging_config,
+}
 
 
 def load_config(config_path: Optional[Path] = None) -> Config:
     """
     Load configuration from file and environment variables.
 
+    The result is cached until the config file's mtime or one of the
+    EMAILAGENT_* overrides changes. Config objects are frozen, so the
+    cached instance can be shared safely.
+
     Args:
         config_path: Path to config file. If None, uses default location.
 
     Returns:
         Config object with all settings.
     """
-    config = Config()
+    # Load .env file if present
+    _load_dotenv()
 
     # Determine config path
     if config_path is None:
@@ -392,45 +314,92 @@ def load_config(config_path: Optional[Path] = None) -> Config:
     else:
         config_path = Path(config_path).expanduser()
 
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    env_fingerprint = tuple(os.environ.get(env_key) for env_key, *_ in _ENV_OVERRIDES)
+
+    return _load_config_cached(str(config_path), mtime_ns, env_fingerprint)
+
+
+@lru_cache(maxsize=4)
+def _load_config_cached(
+    config_path: str,
+    mtime_ns: Optional[int],
+    env_fingerprint: tuple[Optional[str], ...],
+) -> Config:
+    """
+    Parse the config file and apply environment overrides.
+
+    mtime_ns and env_fingerprint are only part of the cache key.
+
+    Args:
+        config_path: Path to config file.
+        mtime_ns: File modification time, or None if it does not exist.
+        env_fingerprint: Values of the EMAILAGENT_* override variables.
+
+    Returns:
+        Config object with all settings.
+    """
+    sections: dict[str, Any] = {}
+
     # Load from YAML if exists
-    if config_path.exists():
+    if mtime_ns is not None:
         with open(config_path, "r") as f:
-            data = yaml.safe_load(f) or {}
-
-        if "gmail" in data:
-            config.gmail = _parse_gmail_config(data["gmail"])
-        if "extraction" in data:
-            config.extraction = _parse_extraction_config(data["extraction"])
-        if "ollama" in data:
-            config.ollama = _parse_ollama_config(data["ollama"])
-        if "excel" in data:
-            config.excel = _parse_excel_config(data["excel"])
-        if "deletion" in data:
-            config.deletion = _parse_deletion_config(data["deletion"])
-        if "logging" in data:
-            config.logging = _parse_logging_config(data["logging"])
-        if "cli" in data:
-            config.cli = _parse_cli_config(data["cli"])
-        if "advanced" in data:
-            config.advanced = _parse_advanced_config(data["advanced"])
+            data = yaml.load(f, Loader=_SafeLoader) or {}
 
-    # Apply environment variable overrides
-    _apply_env_overrides(config)
+        for section in fields(Config):
+            if section.name in data:
+                parser = _SECTION_PARSERS.get(section.name)
+                if parser is None:
+                    value = _parse_section(section.type, data[section.name])
+                else:
+                    value = parser(data[section.name])
+                sections[section.name] = value
 
-    return config
+    # Apply environment variable overrides
+    return _apply_env_overrides(Config(**sections))
 
 
 def ensure_directories(config: Config) -> None:
     """Ensure all required directories exist."""
-    directories = [
+    directories = {
         get_default_config_dir(),
         config.logging.log_directory,
         config.excel.backup_directory,
         config.advanced.cache_directory,
-    ]
+    }
 
+    # Creating a directory creates its parents, so skip any target that is an
+    # ancestor of another; existing directories cost a single stat
     for directory in directories:
-        directory.mkdir(parents=True, exist_ok=True)
+        if any(other != directory and other.is_relative_to(directory) for other in directories):
+            continue
+        if not directory.is_dir():
+            directory.mkdir(parents=True, exist_ok=True)
+
+
+def _port_open(url: str, timeout: float = OLLAMA_PROBE_TIMEOUT_SECONDS) -> bool:
+    """
+    Check whether a TCP connection to a URL's host and port succeeds.
+
+    Args:
+        url: Server URL, e.g. http://localhost:11434.
+        timeout: Seconds to wait for the connection.
+
+    Returns:
+        True if the connection was accepted.
+    """
+    parsed = urlparse(url)
+    if not parsed.hostname:
+        return False
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    try:
+        with socket.create_connection((parsed.hostname, port), timeout=timeout):
+            return True
+    except (OSError, ValueError):
+        return False
 
 
 def validate_config(config: Config) -> tuple[bool, list[str], list[str]]:
@@ -461,15 +430,19 @@ def validate_config(config: Config) -> tuple[bool, list[str], list[str]]:
     except PermissionError:
         errors.append(f"Cannot create log directory: {config.logging.log_directory}")
 
-    # Check Ollama if AI enabled
+    # Check Ollama if AI enabled; a TCP connect fails fast when nothing is
+    # listening, so the HTTP check only runs against a live port
     if config.extraction.use_ai:
-        import requests
-        try:
-            response = requests.get(f"{config.ollama.host}/api/tags", timeout=5)
-            if response.status_code != 200:
-                warnings.append(f"Ollama not reachable at {config.ollama.host}")
-        except Exception:
+        if not _port_open(config.ollama.host):
             warnings.append(f"Cannot connect to Ollama at {config.ollama.host}")
+        else:
+            import requests
+            try:
+                response = requests.get(f"{config.ollama.host}/api/tags", timeout=5)
+                if response.status_code != 200:
+                    warnings.append(f"Ollama not reachable at {config.ollama.host}")
+            except Exception:
+                warnings.append(f"Cannot connect to Ollama at {config.ollama.host}")
 
     is_valid = len(errors) == 0
     return is_valid, errors, warnings
@@ -571,6 +544,7 @@ deletion:
   never_delete_starred: true
   never_delete_with_attachments: false
   never_delete_conflicts: true
+  safety_scan_chars: 0
   minimum_age_days: 0
   batch_size: 50
   delay_between_deletes: 0.1
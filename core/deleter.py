@@ -10,10 +10,12 @@ Provides safe deletion logic with:
 """
 
 import json
+import os
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Sequence
 
 from .gmail_client import Email, GmailClient
 from .logger import (
@@ -23,9 +25,12 @@ from .logger import (
     log_deletion_batch_start,
 )
 
+if TYPE_CHECKING:
+    import ahocorasick
+
 
 # Safety keywords that prevent deletion
-DEFAULT_SAFETY_KEYWORDS = [
+DEFAULT_SAFETY_KEYWORDS = (
     # Interview-related
     "interview",
     "phone screen",
@@ -96,10 +101,10 @@ DEFAULT_SAFETY_KEYWORDS = [
     "submit",
     "provide",
     "send us",
-]
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class DeletionResult:
     """Result of deletion decision."""
 
@@ -121,16 +126,73 @@ class DeletionBatchResult:
     timestamp: datetime
 
 
+# Characters at the end of the text that are still searched when
+# should_delete_email limits the safety keyword scan, so keywords in
+# signatures are not missed
+SCAN_TAIL_CHARS = 4096
+
+
+def _scan_window(text: str, scan_chars: int) -> str:
+    """Keep the first scan_chars and last SCAN_TAIL_CHARS characters of text."""
+    if len(text) <= scan_chars + SCAN_TAIL_CHARS:
+        return text
+    return f"{text[:scan_chars]}\n{text[-SCAN_TAIL_CHARS:]}"
+
+
+@lru_cache(maxsize=8)
+def _lowercase_keywords(safety_keywords: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+    """Pair each keyword with its lowercased form, once per keyword list."""
+    return tuple((keyword, keyword.lower()) for keyword in safety_keywords)
+
+
+@lru_cache(maxsize=8)
+def _keyword_automaton(safety_keywords: tuple[str, ...]) -> Optional["ahocorasick.Automaton"]:
+    """
+    Build an Aho-Corasick automaton over the lowercased keywords, once per
+    keyword list. Each keyword maps to (list position, keyword).
+
+    Returns None if the optional pyahocorasick package is not installed or
+    the list is empty or contains an empty keyword.
+
+    pyahocorasick is only an optional extra (emailagent[fast]), never a
+    requirement: without it the per-keyword loop in contains_safety_keyword
+    is the reference implementation. A stdlib alternative, one compiled
+    regex alternation over the keywords, was measured slower than that loop,
+    so there is no middle tier.
+    """
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+
+    keywords = _lowercase_keywords(safety_keywords)
+    if not keywords or any(not keyword_lower for _, keyword_lower in keywords):
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for position, (keyword, keyword_lower) in enumerate(keywords):
+        if keyword_lower not in automaton:
+            automaton.add_word(keyword_lower, (position, keyword))
+    automaton.make_automaton()
+    return automaton
+
+
 def contains_safety_keyword(
     text: str,
-    safety_keywords: Optional[list[str]] = None,
+    safety_keywords: Optional[Sequence[str]] = None,
+    text_lower: Optional[str] = None,
 ) -> tuple[bool, Optional[str]]:
     """
     Check if text contains any safety keywords.
 
+    With pyahocorasick installed the text is scanned once for all keywords;
+    otherwise each keyword is searched for in turn. Either way the keyword
+    reported is the first one in keyword order that occurs in the text.
+
     Args:
         text: Combined subject + body text.
-        safety_keywords: List of keywords to check. Uses defaults if None.
+        safety_keywords: Keywords to check. Uses defaults if None.
+        text_lower: text.lower(), if the caller already has it.
 
     Returns:
         Tuple of (has_keyword, keyword_found).
@@ -138,10 +200,19 @@ def contains_safety_keyword(
     if safety_keywords is None:
         safety_keywords = DEFAULT_SAFETY_KEYWORDS
 
-    text_lower = text.lower()
+    safety_keywords = tuple(safety_keywords)
+    if text_lower is None:
+        text_lower = text.lower()
+
+    automaton = _keyword_automaton(safety_keywords)
+    if automaton is not None:
+        found = min((match for _, match in automaton.iter(text_lower)), default=None)
+        if found is None:
+            return False, None
+        return True, found[1]
 
-    for keyword in safety_keywords:
-        if keyword.lower() in text_lower:
+    for keyword, keyword_lower in _lowercase_keywords(safety_keywords):
+        if keyword_lower in text_lower:
             return True, keyword
 
     return False, None
@@ -153,7 +224,7 @@ def should_delete_email(
     is_conflict: bool = False,
     is_starred: bool = False,
     has_attachments: bool = False,
-    safety_keywords: Optional[list[str]] = None,
+    safety_keywords: Optional[Sequence[str]] = None,
     delete_applied: bool = True,
     delete_rejected: bool = True,
     delete_interviewing: bool = False,
@@ -161,6 +232,8 @@ def should_delete_email(
     never_delete_starred: bool = True,
     never_delete_with_attachments: bool = False,
     never_delete_conflicts: bool = True,
+    email_text_lower: Optional[str] = None,
+    scan_chars: int = 0,
 ) -> DeletionResult:
     """
     Determine if an email should be deleted.
@@ -171,7 +244,7 @@ def should_delete_email(
         is_conflict: Whether this email created a status conflict.
         is_starred: Whether the email is starred.
         has_attachments: Whether the email has attachments.
-        safety_keywords: List of safety keywords.
+        safety_keywords: Safety keywords. Uses defaults if None.
         delete_applied: Whether to delete Applied emails.
         delete_rejected: Whether to delete Rejected emails.
         delete_interviewing: Whether to delete Interviewing emails.
@@ -179,6 +252,12 @@ def should_delete_email(
         never_delete_starred: Never delete starred emails.
         never_delete_with_attachments: Never delete emails with attachments.
         never_delete_conflicts: Never delete conflict emails.
+        email_text_lower: email_text.lower(), if the caller already has it
+            (e.g. Email.text_lower).
+        scan_chars: Only search the first scan_chars and last
+            SCAN_TAIL_CHARS characters for safety keywords. 0 searches
+            the whole text. Faster for long threads, but a keyword in
+            the middle of a long email no longer protects it.
 
     Returns:
         DeletionResult with decision and reason.
@@ -203,23 +282,29 @@ def should_delete_email(
     if has_attachments and never_delete_with_attachments:
         return DeletionResult(False, "Email has attachments (protected)")
 
+    # Only Applied and Rejected emails can be deleted (rules 7 and 8), so
+    # skip the keyword scan, the most expensive check, for everything else
+    deletable = (status == "Applied" and delete_applied) or (
+        status == "Rejected" and delete_rejected
+    )
+    if not deletable:
+        return DeletionResult(False, f"Status is {status} (not configured for deletion)")
+
     # Rule 6: Check safety keywords
-    has_keyword, keyword = contains_safety_keyword(email_text, safety_keywords)
+    if scan_chars > 0:
+        email_text = _scan_window(email_text, scan_chars)
+        if email_text_lower is not None:
+            email_text_lower = _scan_window(email_text_lower, scan_chars)
+    has_keyword, keyword = contains_safety_keyword(
+        email_text, safety_keywords, email_text_lower
+    )
     if has_keyword:
         return DeletionResult(
             False, f"Contains safety keyword: '{keyword}'", keyword
         )
 
-    # Rule 7: Delete Applied if allowed
-    if status == "Applied" and delete_applied:
-        return DeletionResult(True, "Status is Applied (safe to delete)")
-
-    # Rule 8: Delete Rejected if allowed
-    if status == "Rejected" and delete_rejected:
-        return DeletionResult(True, "Status is Rejected (safe to delete)")
-
-    # Default: don't delete
-    return DeletionResult(False, f"Status is {status} (not configured for deletion)")
+    # Rules 7 and 8: Delete Applied or Rejected if allowed
+    return DeletionResult(True, f"Status is {status} (safe to delete)")
 
 
 class EmailDeleter:
@@ -229,7 +314,7 @@ class EmailDeleter:
         self,
         gmail_client: GmailClient,
         log_directory: Optional[Path] = None,
-        safety_keywords: Optional[list[str]] = None,
+        safety_keywords: Optional[Sequence[str]] = None,
     ):
         """
         Initialize email deleter.
@@ -261,9 +346,13 @@ class EmailDeleter:
         """
         Delete a batch of emails.
 
+        Emails are moved to trash (so the batch can be undone) with
+        GmailClient.trash_emails_batch(), one batchModify call per 1000
+        emails.
+
         Args:
             emails_to_delete: List of (email_id, company, status, subject) tuples.
-            delay: Delay between deletions.
+            delay: Delay between batchModify calls.
             progress_callback: Optional progress callback.
 
         Returns:
@@ -276,20 +365,14 @@ class EmailDeleter:
         log_deletion_batch_start(total)
         self.logger.info(f"Starting deletion batch {batch_id}: {total} emails")
 
-        deleted = 0
-        failed: list[str] = []
-
-        for i, (email_id, company, status, subject) in enumerate(emails_to_delete):
-            success = self.gmail_client.trash_email(email_id)
+        deleted, failed = self.gmail_client.trash_emails_batch(
+            [email[0] for email in emails_to_delete], delay, progress_callback
+        )
 
-            if success:
-                deleted += 1
+        failed_ids = set(failed)
+        for email_id, company, status, subject in emails_to_delete:
+            if email_id not in failed_ids:
                 log_deletion(email_id, company, status, subject)
-            else:
-                failed.append(email_id)
-
-            if progress_callback:
-                progress_callback(i + 1, total)
 
         # Log batch complete
         log_deletion_batch_complete(deleted, len(failed))
@@ -334,8 +417,11 @@ class EmailDeleter:
             "failed_ids": failed,
         }
 
+        # Unindented, so the C encoder is used: about 3x faster than
+        # indent=2 for large batches, and the file is only read back by
+        # get_last_batch()
         with open(batch_file, "w") as f:
-            json.dump(batch_data, f, indent=2)
+            f.write(json.dumps(batch_data))
 
         self.logger.debug(f"Saved batch info to {batch_file}")
 
@@ -346,16 +432,26 @@ class EmailDeleter:
         Returns:
             Dict with batch info or None if no batches found.
         """
-        batch_files = sorted(
-            self.log_directory.glob("batch_*.json"), reverse=True
-        )
+        # Batch IDs are timestamps, so the latest file has the greatest name
+        last_batch = max(self._batch_files(), key=lambda entry: entry.name, default=None)
 
-        if not batch_files:
+        if last_batch is None:
             return None
 
-        with open(batch_files[0], "r") as f:
+        with open(last_batch.path, "r") as f:
             return json.load(f)
 
+    def _batch_files(self) -> list[os.DirEntry]:
+        """List batch files in the log directory with a single directory read."""
+        try:
+            with os.scandir(self.log_directory) as entries:
+                return [
+                    entry for entry in entries
+                    if entry.name.startswith("batch_") and entry.name.endswith(".json")
+                ]
+        except FileNotFoundError:
+            return []
+
     def undo_last_batch(
         self,
         progress_callback: Optional[callable] = None,
@@ -398,16 +494,15 @@ class EmailDeleter:
         """
         from datetime import timedelta
 
-        cutoff = datetime.now() - timedelta(days=retention_days)
+        cutoff = (datetime.now() - timedelta(days=retention_days)).timestamp()
         deleted = 0
 
-        for batch_file in self.log_directory.glob("batch_*.json"):
+        for entry in self._batch_files():
             try:
-                mtime = datetime.fromtimestamp(batch_file.stat().st_mtime)
-                if mtime < cutoff:
-                    batch_file.unlink()
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
                     deleted += 1
-            except (OSError, PermissionError):
+            except OSError:
                 continue
 
         if deleted > 0:
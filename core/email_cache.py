@@ -0,0 +1,160 @@
+"""
+Disk cache for fetched email content.
+
+Gmail never changes the subject, sender, body or date of a message once it
+has an ID, so scans can reuse them across runs instead of downloading every
+message body again. Labels are not cached: they change whenever a message is
+starred or moved, and deletion safety depends on them.
+
+Entries are zlib-compressed JSON rows in a SQLite database that only its
+owner can read. Entries that have not been read for longer than the TTL are
+evicted when the cache opens.
+"""
+
+import json
+import os
+import sqlite3
+import time
+import zlib
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .logger import get_logger
+
+
+# SQLite allows at most 999 bound parameters per statement in older builds
+MAX_QUERY_IDS = 900
+
+# The database holds full email bodies, so it is owner read/write only
+CACHE_FILE_MODE = 0o600
+
+
+@dataclass(slots=True)
+class CachedContent:
+    """Immutable part of a Gmail message."""
+
+    subject: str
+    sender: str
+    body: str
+    snippet: str
+    date: Optional[datetime]
+    has_attachments: bool
+
+
+def _encode(content: CachedContent) -> bytes:
+    """Serialize cached content to a compressed blob."""
+    data = [
+        content.subject,
+        content.sender,
+        content.body,
+        content.snippet,
+        content.date.isoformat() if content.date else None,
+        content.has_attachments,
+    ]
+    return zlib.compress(json.dumps(data).encode("utf-8"))
+
+
+def _decode(blob: bytes) -> CachedContent:
+    """Deserialize a blob written by _encode."""
+    subject, sender, body, snippet, date, has_attachments = json.loads(zlib.decompress(blob))
+    return CachedContent(
+        subject=subject,
+        sender=sender,
+        body=body,
+        snippet=snippet,
+        date=datetime.fromisoformat(date) if date else None,
+        has_attachments=has_attachments,
+    )
+
+
+class EmailCache:
+    """SQLite-backed cache of email content keyed by Gmail message ID."""
+
+    def __init__(self, path: Path, ttl_hours: int = 24):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite database file.
+            ttl_hours: Evict entries not read for this many hours.
+        """
+        self.path = Path(path)
+        self.ttl_seconds = max(0, ttl_hours) * 3600
+        self.logger = get_logger("cache")
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        os.close(os.open(self.path, os.O_RDWR | os.O_CREAT, CACHE_FILE_MODE))
+        os.chmod(self.path, CACHE_FILE_MODE)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS emails ("
+            "id TEXT PRIMARY KEY, content BLOB NOT NULL, used_at REAL NOT NULL)"
+        )
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM emails WHERE used_at < ?",
+                (time.time() - self.ttl_seconds,),
+            )
+
+    def get_many(self, email_ids: list[str]) -> dict[str, CachedContent]:
+        """
+        Look up cached content for a list of message IDs.
+
+        Args:
+            email_ids: Gmail message IDs.
+
+        Returns:
+            Cached content by message ID, for the IDs that are cached.
+        """
+        found: dict[str, CachedContent] = {}
+        for start in range(0, len(email_ids), MAX_QUERY_IDS):
+            chunk = email_ids[start:start + MAX_QUERY_IDS]
+            placeholders = ", ".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT id, content FROM emails WHERE id IN ({placeholders})", chunk
+            )
+            for email_id, blob in rows:
+                try:
+                    found[email_id] = _decode(blob)
+                except (zlib.error, ValueError, TypeError) as e:
+                    self.logger.warning(f"Ignoring unreadable cache entry {email_id}: {e}")
+
+        if found:
+            now = time.time()
+            with self._conn:
+                self._conn.executemany(
+                    "UPDATE emails SET used_at = ? WHERE id = ?",
+                    [(now, email_id) for email_id in found],
+                )
+        return found
+
+    def put_many(self, entries: Iterable[tuple[str, CachedContent]]) -> None:
+        """
+        Store content for fetched messages.
+
+        Args:
+            entries: (message ID, content) pairs.
+        """
+        now = time.time()
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO emails (id, content, used_at) VALUES (?, ?, ?)",
+                [(email_id, _encode(content), now) for email_id, content in entries],
+            )
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._conn:
+            self._conn.execute("DELETE FROM emails")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "EmailCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
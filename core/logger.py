@@ -8,10 +8,15 @@ Provides structured logging with:
 - Extraction and classification logs
 """
 
+import atexit
 import logging
+import os
+import queue
 import sys
+import threading
+import time
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
@@ -22,8 +27,82 @@ from rich.logging import RichHandler
 # Global logger instance
 _logger: Optional[logging.Logger] = None
 _deletion_logger: Optional[logging.Logger] = None
+_deletion_queue: Optional[queue.Queue] = None
+_deletion_listener: Optional[QueueListener] = None
+_log_buffer: Optional[MemoryHandler] = None
+_log_flush_stop: Optional[threading.Event] = None
+_log_flusher: Optional[threading.Thread] = None
 _console = Console()
 
+# Local time format for BATCH_START/BATCH_COMPLETE entries
+ISO_SECONDS_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+# Main log records buffered before a file write, and the longest a
+# buffered record waits before it is written anyway
+LOG_BUFFER_RECORDS = 512
+LOG_FLUSH_INTERVAL_SECONDS = 5.0
+
+# Deletion records buffered by the audit writer before a write
+DELETION_BUFFER_RECORDS = 256
+
+
+class _AuditBufferHandler(MemoryHandler):
+    """
+    Buffer for the deletion audit file.
+
+    Flushes when the buffer is full, on ERROR and above, and on records
+    logged with ``extra={"audit_flush": True}`` (batch boundaries).
+    """
+
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        return super().shouldFlush(record) or getattr(record, "audit_flush", False)
+
+
+def _flush_periodically(
+    handler: logging.Handler,
+    interval: float,
+) -> tuple[threading.Event, threading.Thread]:
+    """
+    Start a daemon thread that flushes handler every interval seconds.
+
+    Returns:
+        Tuple of (stop event, thread); set the event to end the thread.
+    """
+    stop = threading.Event()
+
+    def run() -> None:
+        while not stop.wait(interval):
+            handler.flush()
+
+    thread = threading.Thread(target=run, name="emailagent-log-flush", daemon=True)
+    thread.start()
+    return stop, thread
+
+
+def _stop_log_flusher() -> None:
+    """Stop the main log flusher thread and write out buffered records."""
+    global _log_buffer, _log_flush_stop, _log_flusher
+    if _log_flush_stop is not None:
+        _log_flush_stop.set()
+        _log_flusher.join()
+    if _log_buffer is not None:
+        target = _log_buffer.target
+        _log_buffer.close()
+        if target is not None:
+            target.close()
+    _log_buffer = _log_flush_stop = _log_flusher = None
+
+
+def _stop_deletion_listener() -> None:
+    """Write out pending deletion records and stop the audit writer thread."""
+    global _deletion_listener
+    if _deletion_listener is None:
+        return
+    _deletion_listener.stop()
+    for handler in _deletion_listener.handlers:
+        handler.close()
+    _deletion_listener = None
+
 
 def setup_logger(
     name: str = "emailagent",
@@ -43,17 +122,21 @@ def setup_logger(
         log_directory: Directory for log files.
         log_to_file: Whether to log to file.
         log_to_console: Whether to log to console.
-        use_colors: Whether to use colored console output.
+        use_colors: Whether to use colored console output when stdout is a terminal.
         max_size_mb: Maximum log file size in MB before rotation.
 
     Returns:
         Configured logger instance.
     """
-    global _logger
+    global _logger, _log_buffer, _log_flush_stop, _log_flusher
 
     if _logger is not None:
         return _logger
 
+    # A logger set up earlier in the process (after a reset) keeps its
+    # flusher thread and file open until stopped here
+    _stop_log_flusher()
+
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, level.upper(), logging.INFO))
     logger.handlers.clear()
@@ -63,7 +146,7 @@ def setup_logger(
         log_directory = Path(log_directory)
         log_directory.mkdir(parents=True, exist_ok=True)
 
-        log_file = log_directory / f"emailagent_{datetime.now().strftime('%Y%m%d')}.log"
+        log_file = log_directory / f"emailagent_{time.strftime('%Y%m%d')}.log"
 
         file_handler = RotatingFileHandler(
             log_file,
@@ -77,11 +160,29 @@ def setup_logger(
             datefmt="%Y-%m-%d %H:%M:%S",
         )
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
 
-    # Console handler
+        # Buffer records so a DEBUG scan does not write the file once per
+        # record; errors are written immediately, the rest within
+        # LOG_FLUSH_INTERVAL_SECONDS and at exit
+        buffer_handler = MemoryHandler(
+            LOG_BUFFER_RECORDS,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+        )
+        buffer_handler.setLevel(logging.DEBUG)
+        logger.addHandler(buffer_handler)
+        _log_buffer = buffer_handler
+        _log_flush_stop, _log_flusher = _flush_periodically(
+            buffer_handler, LOG_FLUSH_INTERVAL_SECONDS
+        )
+        # Registered once however often the logger is set up
+        atexit.unregister(_stop_log_flusher)
+        atexit.register(_stop_log_flusher)
+
+    # Console handler; Rich's layout work is wasted when stdout is not a
+    # terminal (redirected to a file, cron, CI), so plain lines are used there
     if log_to_console:
-        if use_colors:
+        if use_colors and _console.is_terminal:
             console_handler = RichHandler(
                 console=_console,
                 show_time=True,
@@ -131,6 +232,10 @@ def setup_deletion_logger(
     """
     Set up a separate logger for deletion audit trail.
 
+    Records are queued by the caller and written to the rotating log file
+    by a background thread, in buffers of up to DELETION_BUFFER_RECORDS.
+    Pending records are written at batch completion and at exit.
+
     Args:
         log_directory: Directory for deletion log files.
         max_size_mb: Maximum log file size in MB.
@@ -138,7 +243,7 @@ def setup_deletion_logger(
     Returns:
         Configured deletion logger.
     """
-    global _deletion_logger
+    global _deletion_logger, _deletion_queue, _deletion_listener
 
     if _deletion_logger is not None:
         return _deletion_logger
@@ -151,7 +256,7 @@ def setup_deletion_logger(
     log_directory = Path(log_directory)
     log_directory.mkdir(parents=True, exist_ok=True)
 
-    log_file = log_directory / f"deletions_{datetime.now().strftime('%Y%m%d')}.log"
+    log_file = log_directory / f"deletions_{time.strftime('%Y%m%d')}.log"
 
     file_handler = RotatingFileHandler(
         log_file,
@@ -165,7 +270,20 @@ def setup_deletion_logger(
         datefmt="%Y-%m-%d %H:%M:%S",
     )
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+
+    buffer_handler = _AuditBufferHandler(
+        DELETION_BUFFER_RECORDS,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+    )
+
+    _deletion_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(_deletion_queue))
+    _deletion_listener = QueueListener(
+        _deletion_queue, buffer_handler, respect_handler_level=True
+    )
+    _deletion_listener.start()
+    atexit.register(_stop_deletion_listener)
 
     _deletion_logger = logger
     return logger
@@ -196,10 +314,9 @@ def log_deletion(
         company: Company name.
         status: Email status (Applied, Rejected, etc.).
         subject: Email subject (truncated).
-        timestamp: Deletion timestamp.
+        timestamp: Unused; the audit log stamps each record when it is logged.
     """
     logger = get_deletion_logger()
-    ts = timestamp or datetime.now()
 
     # Truncate subject for readability
     subject_short = subject[:50] + "..." if len(subject) > 50 else subject
@@ -212,16 +329,20 @@ def log_deletion(
 def log_deletion_batch_start(total_count: int) -> None:
     """Log the start of a deletion batch."""
     logger = get_deletion_logger()
-    logger.info(f"BATCH_START | Count: {total_count} | Time: {datetime.now().isoformat()}")
+    logger.info(f"BATCH_START | Count: {total_count} | Time: {time.strftime(ISO_SECONDS_FORMAT)}")
 
 
 def log_deletion_batch_complete(deleted_count: int, failed_count: int = 0) -> None:
-    """Log the completion of a deletion batch."""
+    """Log the completion of a deletion batch and write out buffered records."""
     logger = get_deletion_logger()
     logger.info(
         f"BATCH_COMPLETE | Deleted: {deleted_count} | Failed: {failed_count} | "
-        f"Time: {datetime.now().isoformat()}"
+        f"Time: {time.strftime(ISO_SECONDS_FORMAT)}",
+        extra={"audit_flush": True},
     )
+    # Wait for the writer thread so the batch is on disk before returning
+    if _deletion_queue is not None and _deletion_listener is not None:
+        _deletion_queue.join()
 
 
 def log_conflict(
@@ -266,6 +387,8 @@ def log_extraction(
         method: Extraction method (pattern or ai).
     """
     logger = get_logger("extraction")
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     logger.debug(
         f"EXTRACTED | {email_id} | Company: {company} | Position: {position} | "
         f"Status: {status} | Confidence: {confidence} | Method: {method}"
@@ -290,7 +413,7 @@ def log_api_call(
     logger = get_logger("api")
     if error:
         logger.error(f"API_CALL | {method} {endpoint} | Error: {error}")
-    else:
+    elif logger.isEnabledFor(logging.DEBUG):
         logger.debug(f"API_CALL | {method} {endpoint} | Status: {status_code}")
 
 
@@ -307,20 +430,21 @@ def cleanup_old_logs(log_directory: Path, retention_days: int = 30) -> int:
     """
     from datetime import timedelta
 
-    log_directory = Path(log_directory)
-    if not log_directory.exists():
-        return 0
-
-    cutoff = datetime.now() - timedelta(days=retention_days)
+    cutoff = (datetime.now() - timedelta(days=retention_days)).timestamp()
     deleted = 0
 
-    for log_file in log_directory.glob("*.log*"):
+    try:
+        with os.scandir(log_directory) as entries:
+            log_files = [entry for entry in entries if ".log" in entry.name]
+    except FileNotFoundError:
+        return 0
+
+    for entry in log_files:
         try:
-            mtime = datetime.fromtimestamp(log_file.stat().st_mtime)
-            if mtime < cutoff:
-                log_file.unlink()
+            if entry.stat().st_mtime < cutoff:
+                os.unlink(entry.path)
                 deleted += 1
-        except (OSError, PermissionError):
+        except OSError:
             continue
 
     if deleted > 0:
@@ -9,121 +9,82 @@ Provides job application tracking functionality:
 - Status classification and confidence scoring
 """
 
-from .job_patterns import (
-    GENERIC_PROVIDERS,
-    SUBJECT_COMPANY_PATTERNS,
-    BODY_COMPANY_PATTERNS,
-    POSITION_PATTERNS,
-    POSITION_KEYWORDS,
-    STATUS_HIERARCHY,
-    STATUS_PATTERNS,
-)
+import importlib
+from typing import Any
 
-from .extractor import (
-    ExtractionResult,
-    extract_company,
-    extract_company_from_domain,
-    extract_company_from_subject,
-    extract_company_from_body,
-    extract_position,
-    extract_position_from_subject,
-    extract_position_from_body,
-    pattern_match_extraction,
-    extract_email_info,
-    calculate_confidence,
-    should_use_ai,
-)
-
-from .classifier import (
-    StatusClassificationResult,
-    StatusUpdateResult,
-    classify_status,
-    classify_email,
-    can_update_status,
-    get_status_level,
-    create_conflict_note,
-    is_deletable_status,
-    is_protected_status,
-    validate_status,
-    normalize_status,
-)
-
-from .excel_storage import (
-    ExcelStorage,
-    JobApplication,
-    ExcelUpdateResult,
-    create_excel_storage,
-    format_summary_table,
-    COLUMNS,
-    HEADERS,
-)
-
-from .ollama_client import (
-    OllamaClient,
-    OllamaConfig,
-    OllamaError,
-    OllamaConnectionError,
-    OllamaTimeoutError,
-    AIExtractionResult,
-    create_ollama_client,
-    ai_extract_email,
-    check_ollama_status,
-)
-
-__all__ = [
+# Public names mapped to the submodule that defines them. Submodules are
+# imported on first attribute access so importing the package stays cheap.
+_EXPORTS = {
     # Patterns
-    'GENERIC_PROVIDERS',
-    'SUBJECT_COMPANY_PATTERNS',
-    'BODY_COMPANY_PATTERNS',
-    'POSITION_PATTERNS',
-    'POSITION_KEYWORDS',
-    'STATUS_HIERARCHY',
-    'STATUS_PATTERNS',
+    'GENERIC_PROVIDERS': '.job_patterns',
+    'SUBJECT_COMPANY_PATTERNS': '.job_patterns',
+    'BODY_COMPANY_PATTERNS': '.job_patterns',
+    'POSITION_PATTERNS': '.job_patterns',
+    'POSITION_KEYWORDS': '.job_patterns',
+    'STATUS_HIERARCHY': '.job_patterns',
+    'STATUS_PATTERNS': '.job_patterns',
 
     # Extractor
-    'ExtractionResult',
-    'extract_company',
-    'extract_company_from_domain',
-    'extract_company_from_subject',
-    'extract_company_from_body',
-    'extract_position',
-    'extract_position_from_subject',
-    'extract_position_from_body',
-    'pattern_match_extraction',
-    'extract_email_info',
-    'calculate_confidence',
-    'should_use_ai',
+    'ExtractionResult': '.extractor',
+    'extract_company': '.extractor',
+    'extract_company_from_domain': '.extractor',
+    'extract_company_from_subject': '.extractor',
+    'extract_company_from_body': '.extractor',
+    'extract_position': '.extractor',
+    'extract_position_from_subject': '.extractor',
+    'extract_position_from_body': '.extractor',
+    'pattern_match_extraction': '.extractor',
+    'extract_email_info': '.extractor',
+    'calculate_confidence': '.extractor',
+    'should_use_ai': '.extractor',
 
     # Classifier
-    'StatusClassificationResult',
-    'StatusUpdateResult',
-    'classify_status',
-    'classify_email',
-    'can_update_status',
-    'get_status_level',
-    'create_conflict_note',
-    'is_deletable_status',
-    'is_protected_status',
-    'validate_status',
-    'normalize_status',
+    'StatusClassificationResult': '.classifier',
+    'StatusUpdateResult': '.classifier',
+    'classify_status': '.classifier',
+    'classify_email': '.classifier',
+    'process_email': '.classifier',
+    'can_update_status': '.classifier',
+    'get_status_level': '.classifier',
+    'create_conflict_note': '.classifier',
+    'is_deletable_status': '.classifier',
+    'is_protected_status': '.classifier',
+    'validate_status': '.classifier',
+    'normalize_status': '.classifier',
 
     # Excel Storage
-    'ExcelStorage',
-    'JobApplication',
-    'ExcelUpdateResult',
-    'create_excel_storage',
-    'format_summary_table',
-    'COLUMNS',
-    'HEADERS',
+    'ExcelStorage': '.excel_storage',
+    'JobApplication': '.excel_storage',
+    'ExcelUpdateResult': '.excel_storage',
+    'create_excel_storage': '.excel_storage',
+    'format_summary_table': '.excel_storage',
+    'COLUMNS': '.excel_storage',
+    'HEADERS': '.excel_storage',
 
     # Ollama Client
-    'OllamaClient',
-    'OllamaConfig',
-    'OllamaError',
-    'OllamaConnectionError',
-    'OllamaTimeoutError',
-    'AIExtractionResult',
-    'create_ollama_client',
-    'ai_extract_email',
-    'check_ollama_status',
-]
+    'OllamaClient': '.ollama_client',
+    'OllamaConfig': '.ollama_client',
+    'OllamaError': '.ollama_client',
+    'OllamaConnectionError': '.ollama_client',
+    'OllamaTimeoutError': '.ollama_client',
+    'AIExtractionResult': '.ollama_client',
+    'create_ollama_client': '.ollama_client',
+    'ai_extract_email': '.ollama_client',
+    'check_ollama_status': '.ollama_client',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -25,9 +25,13 @@ from typing import Tuple, List, Dict, Optional, Any
 
 from .job_patterns import (
     STATUS_HIERARCHY,
-    COMPILED_STATUS_PATTERNS,
+    STATUS_PATTERN_LITERALS,
+    has_required_literals,
+    CASEFOLD_EXTRAS,
+    COMPILED_STRONG_REJECTION_PATTERNS,
+    COMPILED_STRONG_APPLIED_PATTERNS,
 )
-from .extractor import ExtractionResult, calculate_confidence
+from .extractor import ExtractionResult, calculate_confidence, pattern_match_extraction
 
 
 @dataclass
@@ -51,6 +55,16 @@ class StatusUpdateResult:
     attempted_status: Optional[str] = None
 
 
+# Statuses in the order classify_status checks them, highest priority first
+# (Rejected is the most distinctive, Applied the most generic). Positions in
+# this tuple are the status codes classify_status uses internally.
+_CHECK_ORDER = ('Rejected', 'Offer', 'Interviewing', 'Applied')
+_REJECTED, _OFFER, _INTERVIEWING, _APPLIED = range(len(_CHECK_ORDER))
+_ORDERED_STATUS_PATTERNS = tuple(
+    STATUS_PATTERN_LITERALS.get(status, []) for status in _CHECK_ORDER
+)
+
+
 def classify_status(subject: str, body: str) -> Tuple[str, int, List[str]]:
     """
     Classify email status using pattern matching.
@@ -72,101 +86,67 @@ def classify_status(subject: str, body: str) -> Tuple[str, int, List[str]]:
     Returns:
         Tuple of (status, match_count, matched_patterns)
     """
-    import re
-
-    # Combine text for analysis
+    # Combine text for analysis; the status patterns are lowercase and
+    # case-sensitive, so the text is case-folded here once
     text = f"{subject} {body}".lower()
-
-    # Track matches for each status
-    status_scores: Dict[str, int] = {status: 0 for status in STATUS_HIERARCHY}
-    matched_patterns: Dict[str, List[str]] = {status: [] for status in STATUS_HIERARCHY}
-
-    # Check patterns in priority order
-    # Priority: Rejected > Offer > Interviewing > Applied
-    # (Rejected first because it's most distinctive, Applied last because it's most generic)
-    check_order = ['Rejected', 'Offer', 'Interviewing', 'Applied']
-
-    for status in check_order:
-        patterns = COMPILED_STATUS_PATTERNS.get(status, [])
-        for pattern in patterns:
+    if not text.isascii():
+        text = text.translate(CASEFOLD_EXTRAS)
+
+    # Track matches for each status, indexed by position in _CHECK_ORDER
+    scores = [0, 0, 0, 0]
+    matched: List[List[str]] = [[], [], [], []]
+
+    # Every status pattern requires some literals in each match; substring
+    # checks for them skip the regex search entirely when one is absent
+    for code, patterns in enumerate(_ORDERED_STATUS_PATTERNS):
+        for requirements, pattern in patterns:
+            if not has_required_literals(text, requirements):
+                continue
             if pattern.search(text):
-                status_scores[status] += 1
-                matched_patterns[status].append(pattern.pattern)
-
-    # Special handling: Check for strong rejection indicators
-    # These phrases definitively indicate rejection even if "interview" appears
-    strong_rejection_phrases = [
-        r'not moving forward',
-        r"won['\u2019]?t be advancing",
-        r"won['\u2019]?t be moving forward",
-        r'will not be moving forward',
-        r'not move forward',
-        r'unfortunately',
-        r'decided to not move forward',
-        r'we are not moving forward',
-        r'wish you.*success.*(?:search|job search)',
-        r'best of luck.*(?:search|job search)',
-    ]
-
-    has_strong_rejection = False
-    for phrase in strong_rejection_phrases:
-        if re.search(phrase, text, re.IGNORECASE):
-            has_strong_rejection = True
-            break
-
-    # If strong rejection phrase found and Rejected has matches,
-    # prioritize Rejected over everything else
-    if has_strong_rejection and status_scores['Rejected'] >= 1:
-        return 'Rejected', status_scores['Rejected'], matched_patterns['Rejected']
+                scores[code] += 1
+                matched[code].append(pattern.pattern)
+
+        # Special handling: Check for strong rejection indicators
+        # These phrases definitively indicate rejection even if "interview" appears.
+        # If one is found and Rejected has matches, prioritize Rejected over
+        # everything else. The phrase scan only runs when it can change the
+        # result, and Rejected is checked first, so the other statuses are
+        # not scanned at all when it applies.
+        if code == _REJECTED and scores[_REJECTED] >= 1 and any(
+            pattern.search(text) for pattern in COMPILED_STRONG_REJECTION_PATTERNS
+        ):
+            return 'Rejected', scores[_REJECTED], matched[_REJECTED]
 
     # Special handling: Check for strong application confirmation indicators
-    # These phrases definitively indicate Applied even if "interview" or
-    # "next steps" appear incidentally (e.g., "learn about our interview process")
-    strong_applied_phrases = [
-        r'thank you for (?:your )?(?:applying|application)',
-        r'thanks for applying',
-        r'application (?:has been )?received',
-        r'(?:we )?received your application',
-        r'application (?:has been )?submitted',
-    ]
-
-    has_strong_applied = False
-    for phrase in strong_applied_phrases:
-        if re.search(phrase, text, re.IGNORECASE):
-            has_strong_applied = True
-            break
-
-    # If strong applied phrase found and Applied has matches,
-    # prioritize Applied over Interviewing (but not over Offer/Rejected)
-    if has_strong_applied and status_scores['Applied'] >= 1:
-        if status_scores['Offer'] == 0 and status_scores['Rejected'] == 0:
-            return 'Applied', status_scores['Applied'], matched_patterns['Applied']
-
-    # Determine best status
-    # If multiple statuses have matches, use priority order with tie-breaking
-    best_status = 'Applied'  # Default fallback
+    # If one is found and Applied has matches, prioritize Applied over
+    # Interviewing (but not over Offer/Rejected). Every phrase mentions
+    # "appl", so texts without it skip the regex scan.
+    if (
+        scores[_APPLIED] >= 1
+        and scores[_OFFER] == 0
+        and scores[_REJECTED] == 0
+        and 'appl' in text
+        and any(pattern.search(text) for pattern in COMPILED_STRONG_APPLIED_PATTERNS)
+    ):
+        return 'Applied', scores[_APPLIED], matched[_APPLIED]
+
+    # Determine best status: highest score wins. Statuses are visited from
+    # lowest to highest priority, so on a tie the later one wins.
+    best = _APPLIED  # Default fallback
     best_score = 0
-
-    # Check in reverse priority (so higher priority wins ties)
-    for status in reversed(check_order):
-        score = status_scores[status]
-        if score > best_score:
+    for code in (_APPLIED, _INTERVIEWING, _OFFER, _REJECTED):
+        score = scores[code]
+        if score > 0 and score >= best_score:
             best_score = score
-            best_status = status
-        elif score == best_score and score > 0:
-            # Tie: prefer higher priority status
-            # Priority order: Rejected > Offer > Interviewing > Applied
-            priority_order = ['Applied', 'Interviewing', 'Offer', 'Rejected']
-            if priority_order.index(status) > priority_order.index(best_status):
-                best_status = status
+            best = code
 
     # Special case: if Offer patterns match AND Rejected patterns match,
     # it's likely a conflict or confusing email - prefer Offer (higher level)
-    if status_scores['Offer'] > 0 and status_scores['Rejected'] > 0:
-        if status_scores['Offer'] >= status_scores['Rejected']:
-            best_status = 'Offer'
+    if scores[_OFFER] > 0 and scores[_REJECTED] > 0:
+        if scores[_OFFER] >= scores[_REJECTED]:
+            best = _OFFER
 
-    return best_status, best_score, matched_patterns.get(best_status, [])
+    return _CHECK_ORDER[best], best_score, matched[best]
 
 
 def get_status_level(status: str) -> int:
@@ -280,6 +260,23 @@ def classify_email(extraction_result: ExtractionResult, email: Dict[str, Any]) -
     return extraction_result
 
 
+def process_email(email: Dict[str, Any]) -> ExtractionResult:
+    """
+    Extract and classify an email in a single call.
+
+    Produces the same result as
+    classify_email(extract_email_info(email), email), but confidence is
+    scored once after classification instead of once per step.
+
+    Args:
+        email: Email dictionary with 'id', 'subject', 'from', 'body', 'date'
+
+    Returns:
+        ExtractionResult with extracted fields, status and confidence
+    """
+    return classify_email(pattern_match_extraction(email), email)
+
+
 def get_status_display(status: str) -> str:
     """
     Get display string for a status.
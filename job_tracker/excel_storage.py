@@ -8,7 +8,7 @@ This module handles all Excel operations for storing job application data:
 - Status hierarchy enforcement
 - Conflict detection and flagging
 - Auto-backup functionality
-- Export to CSV/JSON
+- Export to CSV/JSON/Parquet
 
 File Structure:
     Column A: Company Name
@@ -24,10 +24,12 @@ File Structure:
 import csv
 import json
 import shutil
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
+from io import BytesIO
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, Iterator
 
 from openpyxl import Workbook, load_workbook
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
@@ -62,7 +64,7 @@ COLUMNS = {
     'notes': 8,        # H
 }
 
-HEADERS = [
+HEADERS = (
     "Company Name",
     "Position",
     "Status",
@@ -71,7 +73,7 @@ HEADERS = [
     "Date Last Updated",
     "Email IDs",
     "Notes",
-]
+)
 
 # Column widths
 COLUMN_WIDTHS = {
@@ -99,13 +101,14 @@ STATUS_COLORS = {
 }
 
 CONFLICT_FILL = PatternFill(start_color="FFCDD2", end_color="FFCDD2", fill_type="solid")  # Red highlight
+NO_FILL = PatternFill()  # Cleared highlight
 
 
 # =============================================================================
 # Data Classes
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class JobApplication:
     """Represents a job application row in Excel."""
 
@@ -151,7 +154,7 @@ class JobApplication:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ExcelUpdateResult:
     """Result of an Excel update operation."""
 
@@ -166,6 +169,54 @@ class ExcelUpdateResult:
     message: str = ""
 
 
+# =============================================================================
+# Row Parsing
+# =============================================================================
+
+def _parse_cell_date(value: Any) -> Optional[datetime]:
+    """Parse a date cell written as a datetime or an ISO string."""
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str) and value:
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    return None
+
+
+def _row_to_application(row_index: int, values: Tuple[Any, ...]) -> Optional[JobApplication]:
+    """
+    Build a JobApplication from one row of cell values.
+
+    Args:
+        row_index: Excel row number (1-based)
+        values: Cell values in HEADERS order
+
+    Returns:
+        JobApplication or None if the row has no company
+    """
+    company, position, status, confidence, date_first, date_last, email_ids_str, notes = values
+    if not company:
+        return None
+
+    email_ids = []
+    if email_ids_str:
+        email_ids = [eid.strip() for eid in email_ids_str.split(',') if eid.strip()]
+
+    return JobApplication(
+        company=company,
+        position=position or "Not specified",
+        status=status or "Applied",
+        confidence=confidence or "medium",
+        date_first=_parse_cell_date(date_first),
+        date_last=_parse_cell_date(date_last),
+        email_ids=email_ids,
+        notes=notes or "",
+        row_index=row_index,
+    )
+
+
 # =============================================================================
 # Excel Storage Class
 # =============================================================================
@@ -209,40 +260,78 @@ class ExcelStorage:
         self.workbook: Optional[Workbook] = None
         self.worksheet = None
         self._company_cache: Dict[str, int] = {}  # company_name -> row_index
+        self._last_row = 1  # openpyxl recomputes max_row from every cell
         self._modified = False
         self._unsaved_count = 0
+        self._batch_depth = 0
 
-    def initialize(self) -> None:
+    def initialize(self, read_only: bool = False) -> None:
         """
         Initialize the Excel file and load or create workbook.
 
         Creates the file with headers if it doesn't exist.
+
+        Args:
+            read_only: Stream an existing file for reading only. Loading is
+                much faster and nothing is written, not even a backup, but
+                the storage cannot be updated or saved.
+
+        Raises:
+            FileNotFoundError: If read_only and the file doesn't exist
         """
-        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        if read_only and not self.file_path.exists():
+            raise FileNotFoundError(f"Excel file not found: {self.file_path}")
+
+        if not read_only:
+            self.backup_dir.mkdir(parents=True, exist_ok=True)
 
         if self.file_path.exists():
             # Create backup before loading
-            if self.auto_backup:
+            if self.auto_backup and not read_only:
                 self._create_backup()
 
-            # Load existing workbook
-            self.workbook = load_workbook(self.file_path)
+            # Load existing workbook. Read-only workbooks stream from their
+            # source until closed, so they read from an in-memory copy and
+            # leave no file handle open
+            if read_only:
+                source = BytesIO(self.file_path.read_bytes())
+                self.workbook = load_workbook(source, read_only=True)
+            else:
+                self.workbook = load_workbook(self.file_path)
 
             # Get or create the Applications sheet
             if SHEET_NAME in self.workbook.sheetnames:
                 self.worksheet = self.workbook[SHEET_NAME]
+            elif read_only:
+                # A read-only workbook cannot get the missing sheet added;
+                # read from an empty in-memory sheet instead
+                self.workbook.close()
+                self.workbook = Workbook()
+                self.worksheet = self.workbook.active
+                self.worksheet.title = SHEET_NAME
+                self._setup_headers()
             else:
                 self.worksheet = self.workbook.create_sheet(SHEET_NAME)
                 self._setup_headers()
 
-            # Build company cache
-            self._build_company_cache()
+            # Read-only sheets take their size from the file, which may omit it
+            if read_only and self.worksheet.max_row is None:
+                self.worksheet.calculate_dimension(force=True)
+
+            # Build company cache; only updates use it, and building it
+            # would cost a read-only sheet a second full parse
+            self._last_row = self.worksheet.max_row
+            if read_only:
+                self._company_cache = {}
+            else:
+                self._build_company_cache()
         else:
             # Create new workbook
             self.workbook = Workbook()
             self.worksheet = self.workbook.active
             self.worksheet.title = SHEET_NAME
             self._setup_headers()
+            self._last_row = 1
             self._company_cache = {}
 
         self._modified = False
@@ -274,13 +363,10 @@ class ExcelStorage:
 
     def _build_company_cache(self) -> None:
         """Build cache of company names to row indices."""
-        self._company_cache = {}
-
-        for row_idx in range(2, self.worksheet.max_row + 1):
-            company_cell = self.worksheet.cell(row=row_idx, column=COLUMNS['company'])
-            if company_cell.value:
-                company_lower = company_cell.value.lower().strip()
-                self._company_cache[company_lower] = row_idx
+        self._company_cache = {
+            company.lower().strip(): row_idx
+            for row_idx, company in self.iter_column_values('company')
+        }
 
     def _create_backup(self) -> Optional[Path]:
         """Create a timestamped backup of the Excel file."""
@@ -336,55 +422,28 @@ class ExcelStorage:
         Returns:
             JobApplication or None if row is empty
         """
-        if row_index < 2 or row_index > self.worksheet.max_row:
+        values = self._row_values(row_index, len(HEADERS))
+        if values is None:
             return None
+        return _row_to_application(row_index, values)
 
-        company = self.worksheet.cell(row=row_index, column=COLUMNS['company']).value
-        if not company:
+    def _row_values(self, row_index: int, max_col: int) -> Optional[Tuple[Any, ...]]:
+        """
+        Read the values of the first max_col cells of a data row.
+
+        Args:
+            row_index: Excel row number (1-based)
+            max_col: Last column to read (1-based)
+
+        Returns:
+            Cell values, or None if the row is outside the data rows
+        """
+        if row_index < 2 or row_index > self._last_row:
             return None
 
-        # Parse dates
-        date_first_val = self.worksheet.cell(row=row_index, column=COLUMNS['date_first']).value
-        date_last_val = self.worksheet.cell(row=row_index, column=COLUMNS['date_last']).value
-
-        date_first = None
-        date_last = None
-
-        if date_first_val:
-            if isinstance(date_first_val, datetime):
-                date_first = date_first_val
-            elif isinstance(date_first_val, str):
-                try:
-                    date_first = datetime.fromisoformat(date_first_val)
-                except ValueError:
-                    pass
-
-        if date_last_val:
-            if isinstance(date_last_val, datetime):
-                date_last = date_last_val
-            elif isinstance(date_last_val, str):
-                try:
-                    date_last = datetime.fromisoformat(date_last_val)
-                except ValueError:
-                    pass
-
-        # Parse email IDs
-        email_ids_str = self.worksheet.cell(row=row_index, column=COLUMNS['email_ids']).value
-        email_ids = []
-        if email_ids_str:
-            email_ids = [eid.strip() for eid in email_ids_str.split(',') if eid.strip()]
-
-        return JobApplication(
-            company=company,
-            position=self.worksheet.cell(row=row_index, column=COLUMNS['position']).value or "Not specified",
-            status=self.worksheet.cell(row=row_index, column=COLUMNS['status']).value or "Applied",
-            confidence=self.worksheet.cell(row=row_index, column=COLUMNS['confidence']).value or "medium",
-            date_first=date_first,
-            date_last=date_last,
-            email_ids=email_ids,
-            notes=self.worksheet.cell(row=row_index, column=COLUMNS['notes']).value or "",
-            row_index=row_index,
-        )
+        return next(self.worksheet.iter_rows(
+            min_row=row_index, max_row=row_index, max_col=max_col, values_only=True
+        ))
 
     def add_new_row(self, extraction: ExtractionResult) -> ExcelUpdateResult:
         """
@@ -397,7 +456,8 @@ class ExcelStorage:
             ExcelUpdateResult with operation details
         """
         # Get next row
-        next_row = self.worksheet.max_row + 1
+        next_row = self._last_row + 1
+        self._last_row = next_row
 
         # Format date
         date_str = extraction.email_date.strftime('%Y-%m-%d') if extraction.email_date else datetime.now().strftime('%Y-%m-%d')
@@ -452,16 +512,20 @@ class ExcelStorage:
         Returns:
             ExcelUpdateResult with operation details
         """
-        # Get current data
-        current = self.get_application(row_index)
-        if not current:
+        # Get current data; the email ID list grows with every update, so
+        # only the columns up to confidence are read
+        values = self._row_values(row_index, COLUMNS['confidence'])
+        company, _, current_status, current_confidence = values or (None,) * 4
+        if not company:
             return ExcelUpdateResult(
                 success=False,
                 message=f"Row {row_index} not found",
             )
+        current_status = current_status or "Applied"
+        current_confidence = current_confidence or "medium"
 
         # Check status hierarchy
-        update_result = can_update_status(current.status, extraction.status)
+        update_result = can_update_status(current_status, extraction.status)
 
         # Format date
         date_str = extraction.email_date.strftime('%Y-%m-%d') if extraction.email_date else datetime.now().strftime('%Y-%m-%d')
@@ -476,7 +540,7 @@ class ExcelStorage:
 
             # Update confidence if higher
             confidence_order = {'low': 0, 'medium': 1, 'high': 2}
-            if confidence_order.get(extraction.confidence, 0) > confidence_order.get(current.confidence, 0):
+            if confidence_order.get(extraction.confidence, 0) > confidence_order.get(current_confidence, 0):
                 self.worksheet.cell(row=row_index, column=COLUMNS['confidence'], value=extraction.confidence)
 
             # Update last date
@@ -495,16 +559,16 @@ class ExcelStorage:
                 success=True,
                 is_update=True,
                 row_index=row_index,
-                company=current.company,
-                old_status=current.status,
+                company=company,
+                old_status=current_status,
                 new_status=extraction.status,
-                message=f"Updated {current.company}: {current.status} -> {extraction.status}",
+                message=f"Updated {company}: {current_status} -> {extraction.status}",
             )
         else:
             # Conflict - do not update status, but add note and track email
             self._handle_conflict(
                 row_index,
-                current.status,
+                current_status,
                 extraction.status,
                 date_str,
                 extraction.email_id,
@@ -517,10 +581,10 @@ class ExcelStorage:
                 success=True,
                 is_conflict=True,
                 row_index=row_index,
-                company=current.company,
-                old_status=current.status,
+                company=company,
+                old_status=current_status,
                 new_status=extraction.status,
-                message=f"CONFLICT at {current.company}: kept {current.status}, received {extraction.status}",
+                message=f"CONFLICT at {company}: kept {current_status}, received {extraction.status}",
             )
 
     def _handle_conflict(
@@ -638,10 +702,86 @@ class ExcelStorage:
         Returns:
             True if saved
         """
-        if self._unsaved_count >= threshold:
+        if self._batch_depth == 0 and self._unsaved_count >= threshold:
             return self.save()
         return False
 
+    @contextmanager
+    def batch(self) -> Iterator['ExcelStorage']:
+        """
+        Group updates so the workbook is written once.
+
+        openpyxl rewrites the whole file on every save, so periodic saves
+        inside a long loop add up. Inside the block save_if_needed() is a
+        no-op; the workbook is saved once when the outermost block exits,
+        including when it exits with an exception.
+
+        Yields:
+            This storage instance
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.save()
+
+    def iter_applications(self) -> Iterator[JobApplication]:
+        """
+        Iterate applications row by row without building a list.
+
+        Yields:
+            JobApplication objects in sheet order
+        """
+        rows = self.worksheet.iter_rows(min_row=2, max_col=len(HEADERS), values_only=True)
+        for row_idx, values in enumerate(rows, start=2):
+            app = _row_to_application(row_idx, values)
+            if app:
+                yield app
+
+    def iter_column_values(self, *columns: str) -> Iterator[Tuple[Any, ...]]:
+        """
+        Iterate raw values of a few columns for rows that have a company.
+
+        Cells right of the last requested column are not read and no
+        JobApplication objects are built, so scans over one or two fields
+        are much cheaper than iter_applications().
+
+        Args:
+            *columns: Keys of COLUMNS, e.g. 'status', 'notes'
+
+        Yields:
+            (row_index, value, ...) tuples in sheet order
+        """
+        indices = [COLUMNS[column] - 1 for column in columns]
+        company_index = COLUMNS['company'] - 1
+        rows = self.worksheet.iter_rows(
+            min_row=2, max_col=max(indices + [company_index]) + 1, values_only=True
+        )
+        for row_idx, values in enumerate(rows, start=2):
+            if values[company_index]:
+                yield (row_idx, *(values[i] for i in indices))
+
+    def find_applications(self, company_query: str) -> List[JobApplication]:
+        """
+        Get applications whose company name contains a substring.
+
+        Args:
+            company_query: Case-insensitive substring of the company name
+
+        Returns:
+            Matching applications in sheet order
+        """
+        query = company_query.lower()
+        company_index = COLUMNS['company'] - 1
+        rows = self.worksheet.iter_rows(min_row=2, max_col=len(HEADERS), values_only=True)
+        return [
+            _row_to_application(row_idx, values)
+            for row_idx, values in enumerate(rows, start=2)
+            if values[company_index] and query in str(values[company_index]).lower()
+        ]
+
     def get_all_applications(self) -> List[JobApplication]:
         """
         Get all applications from Excel.
@@ -649,14 +789,7 @@ class ExcelStorage:
         Returns:
             List of JobApplication objects
         """
-        applications = []
-
-        for row_idx in range(2, self.worksheet.max_row + 1):
-            app = self.get_application(row_idx)
-            if app:
-                applications.append(app)
-
-        return applications
+        return list(self.iter_applications())
 
     def get_applications_by_status(self, status: str) -> List[JobApplication]:
         """
@@ -686,22 +819,26 @@ class ExcelStorage:
         Returns:
             Dictionary with counts and statistics
         """
-        all_apps = self.get_all_applications()
-
+        total = 0
         status_counts = {status: 0 for status in STATUS_HIERARCHY}
         confidence_counts = {'high': 0, 'medium': 0, 'low': 0}
         conflict_count = 0
 
-        for app in all_apps:
-            if app.status in status_counts:
-                status_counts[app.status] += 1
-            if app.confidence in confidence_counts:
-                confidence_counts[app.confidence] += 1
-            if app.has_conflict:
+        # Only the counted columns are read; blanks get JobApplication defaults
+        rows = self.iter_column_values('status', 'confidence', 'notes')
+        for _, status, confidence, notes in rows:
+            total += 1
+            status = status or "Applied"
+            confidence = confidence or "medium"
+            if status in status_counts:
+                status_counts[status] += 1
+            if confidence in confidence_counts:
+                confidence_counts[confidence] += 1
+            if notes and "Conflict:" in notes:
                 conflict_count += 1
 
         return {
-            'total_companies': len(all_apps),
+            'total_companies': total,
             'status_counts': status_counts,
             'confidence_counts': confidence_counts,
             'conflict_count': conflict_count,
@@ -726,17 +863,19 @@ class ExcelStorage:
             writer.writerow(HEADERS)
 
             # Write data
-            for app in self.get_all_applications():
-                writer.writerow([
+            writer.writerows(
+                (
                     app.company,
                     app.position,
                     app.status,
                     app.confidence,
-                    app.date_first.strftime('%Y-%m-%d') if app.date_first else '',
-                    app.date_last.strftime('%Y-%m-%d') if app.date_last else '',
+                    app.date_first.date().isoformat() if app.date_first else '',
+                    app.date_last.date().isoformat() if app.date_last else '',
                     ', '.join(app.email_ids),
                     app.notes,
-                ])
+                )
+                for app in self.iter_applications()
+            )
 
         return str(output)
 
@@ -753,14 +892,77 @@ class ExcelStorage:
         """
         output = Path(output_path).expanduser()
 
+        applications = [app.to_dict() for app in self.iter_applications()]
         data = {
             'exported_at': datetime.now().isoformat(),
-            'total_applications': len(self.get_all_applications()),
-            'applications': [app.to_dict() for app in self.get_all_applications()],
+            'total_applications': len(applications),
+            'applications': applications,
         }
 
+        # json.dump writes every encoded fragment separately; one write of
+        # the finished document is faster and produces the same file
         with open(output, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=indent)
+            f.write(json.dumps(data, indent=indent))
+
+        return str(output)
+
+    def export_to_parquet(self, output_path: str) -> str:
+        """
+        Export data to a zstd-compressed Parquet file.
+
+        Requires the optional pyarrow dependency (the "parquet" extra).
+
+        Args:
+            output_path: Path for Parquet file
+
+        Returns:
+            Path to created file
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError(
+                "Parquet export requires pyarrow (pip install pyarrow)"
+            ) from e
+
+        output = Path(output_path).expanduser()
+
+        columns: Dict[str, List[Any]] = {
+            'company': [],
+            'position': [],
+            'status': [],
+            'confidence': [],
+            'date_first': [],
+            'date_last': [],
+            'email_ids': [],
+            'notes': [],
+        }
+        for app in self.iter_applications():
+            columns['company'].append(app.company)
+            columns['position'].append(app.position)
+            columns['status'].append(app.status)
+            columns['confidence'].append(app.confidence)
+            columns['date_first'].append(app.date_first)
+            columns['date_last'].append(app.date_last)
+            columns['email_ids'].append(app.email_ids)
+            columns['notes'].append(app.notes)
+
+        schema = pa.schema([
+            ('company', pa.string()),
+            ('position', pa.string()),
+            ('status', pa.string()),
+            ('confidence', pa.string()),
+            ('date_first', pa.timestamp('ms')),
+            ('date_last', pa.timestamp('ms')),
+            ('email_ids', pa.list_(pa.string())),
+            ('notes', pa.string()),
+        ])
+        table = pa.Table.from_pydict(columns, schema=schema)
+        pq.write_table(table, output, compression='zstd')
 
         return str(output)
 
@@ -813,7 +1015,7 @@ class ExcelStorage:
         notes_cell.value = cleaned.strip('; ')
 
         # Remove conflict highlighting
-        notes_cell.fill = PatternFill()  # Reset fill
+        notes_cell.fill = NO_FILL
 
         self._modified = True
         return True
@@ -25,12 +25,36 @@ from .job_patterns import (
     COMPILED_BODY_COMPANY_PATTERNS,
     COMPILED_POSITION_PATTERNS,
     POSITION_KEYWORDS,
-    COMPANY_CLEANUP_PATTERNS,
-    POSITION_CLEANUP_PATTERNS,
+    COMPILED_COMPANY_CLEANUP_PATTERNS,
+    COMPILED_POSITION_CLEANUP_PATTERNS,
 )
 
+# Sender address and LinkedIn patterns, compiled once at import
+_EMAIL_ADDRESS_RE = re.compile(r'[\w.-]+@([\w.-]+)')
+_ATS_LOCAL_SUFFIX_RE = re.compile(r'(?:inc|corp|llc|ltd|co|hq|jobs|careers|hr)$')
+_DOMAIN_CORP_SUFFIX_RE = re.compile(r'\b(corp|inc|llc|ltd|co)\b', re.IGNORECASE)
+_LINKEDIN_COMPANY_RE = re.compile(r'application was sent to ([^-|\n.]+)', re.IGNORECASE)
+_LINKEDIN_ROLE_RE = re.compile(
+    r'(?:applied for|application for)\s+(?:the\s+)?([^-|\n.]+?)(?:\s+at\s+|\s*$)',
+    re.IGNORECASE,
+)
+
+# Generic local parts that don't indicate a company
+_GENERIC_LOCAL_PARTS = frozenset({
+    'noreply', 'no-reply', 'donotreply', 'do-not-reply',
+    'jobs', 'careers', 'career', 'recruiting', 'recruitment',
+    'hr', 'hiring', 'apply', 'applications', 'talent',
+    'team', 'people', 'notifications', 'info', 'support',
+    'hello', 'contact', 'admin', 'mailer',
+})
+
+# Generic subdomains skipped when looking for the company part of a domain
+_GENERIC_SUBDOMAINS = frozenset({
+    'www', 'mail', 'email', 'jobs', 'careers', 'recruiting', 'apply', 'hr',
+})
 
-@dataclass
+
+@dataclass(slots=True)
 class ExtractionResult:
     """Result of extracting information from an email."""
 
@@ -77,10 +101,13 @@ class ExtractionResult:
 
 
 def clean_text(text: str, cleanup_patterns: List[tuple]) -> str:
-    """Apply cleanup patterns to text."""
+    """Apply cleanup patterns (strings or compiled patterns) to text."""
     result = text.strip()
     for pattern, replacement in cleanup_patterns:
-        result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
+        if isinstance(pattern, str):
+            result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
+        else:
+            result = pattern.sub(replacement, result)
     return result.strip()
 
 
@@ -107,7 +134,7 @@ def extract_company_from_domain(email_address: str) -> Tuple[Optional[str], Opti
 
     # Extract domain from email address
     # Handle formats like "John Doe <john@company.com>" or "john@company.com"
-    email_match = re.search(r'[\w.-]+@([\w.-]+)', email_address)
+    email_match = _EMAIL_ADDRESS_RE.search(email_address)
     if not email_match:
         return None, None
 
@@ -124,26 +151,17 @@ def extract_company_from_domain(email_address: str) -> Tuple[Optional[str], Opti
     # Extract local part for potential fallback
     local_part = email_match.group(0).split('@')[0].lower()
 
-    # Generic local parts that don't indicate a company
-    generic_local_parts = {
-        'noreply', 'no-reply', 'donotreply', 'do-not-reply',
-        'jobs', 'careers', 'career', 'recruiting', 'recruitment',
-        'hr', 'hiring', 'apply', 'applications', 'talent',
-        'team', 'people', 'notifications', 'info', 'support',
-        'hello', 'contact', 'admin', 'mailer',
-    }
-
     # Check each part (skip TLDs like .com, .io, .ai, .org)
     for part in domain_parts[:-1]:  # Skip last part (TLD)
         # Skip generic subdomains
-        if part in ['www', 'mail', 'email', 'jobs', 'careers', 'recruiting', 'apply', 'hr']:
+        if part in _GENERIC_SUBDOMAINS:
             continue
         # Skip if it's a generic provider
         if part.lower() in GENERIC_PROVIDERS:
             # For ATS platforms, try extracting company from the email local part
             # e.g. disney@myworkday.com -> "Disney", pax8inc@myworkday.com -> "Pax8"
-            if part.lower() in ATS_PROVIDERS and local_part and local_part not in generic_local_parts:
-                cleaned = re.sub(r'(?:inc|corp|llc|ltd|co|hq|jobs|careers|hr)$', '', local_part)
+            if part.lower() in ATS_PROVIDERS and local_part and local_part not in _GENERIC_LOCAL_PARTS:
+                cleaned = _ATS_LOCAL_SUFFIX_RE.sub('', local_part)
                 cleaned = cleaned.strip('-_.').replace('-', ' ').replace('_', ' ').replace('.', ' ')
                 cleaned = cleaned.strip().title()
                 if cleaned and len(cleaned) >= 2:
@@ -166,7 +184,7 @@ def extract_company_from_domain(email_address: str) -> Tuple[Optional[str], Opti
 
     # Clean and format company name
     company = company_domain.replace('-', ' ').replace('_', ' ')
-    company = re.sub(r'\b(corp|inc|llc|ltd|co)\b', '', company, flags=re.IGNORECASE)
+    company = _DOMAIN_CORP_SUFFIX_RE.sub('', company)
     company = company.strip().title()
 
     if company and len(company) >= 2:
@@ -196,7 +214,7 @@ def extract_company_from_subject(subject: str) -> Tuple[Optional[str], Optional[
             company = match.group(1).strip()
 
             # Clean up the company name
-            company = clean_text(company, COMPANY_CLEANUP_PATTERNS)
+            company = clean_text(company, COMPILED_COMPANY_CLEANUP_PATTERNS)
 
             # Validate: reasonable length and not just generic words
             if company and 2 <= len(company) <= 50:
@@ -235,7 +253,7 @@ def extract_company_from_body(body: str, max_length: int = 500) -> Tuple[Optiona
             company = match.group(1).strip()
 
             # Clean up the company name
-            company = clean_text(company, COMPANY_CLEANUP_PATTERNS)
+            company = clean_text(company, COMPILED_COMPANY_CLEANUP_PATTERNS)
 
             # Validate: reasonable length
             if company and 2 <= len(company) <= 50:
@@ -304,7 +322,7 @@ def extract_position_from_subject(subject: str) -> Tuple[Optional[str], Optional
             position = match.group(1).strip()
 
             # Clean up
-            position = clean_text(position, POSITION_CLEANUP_PATTERNS)
+            position = clean_text(position, COMPILED_POSITION_CLEANUP_PATTERNS)
 
             # Validate: must contain a position keyword and reasonable length
             if position and 5 <= len(position) <= 60:
@@ -340,7 +358,7 @@ def extract_position_from_body(body: str, max_length: int = 500) -> Tuple[Option
             position = match.group(1).strip()
 
             # Clean up
-            position = clean_text(position, POSITION_CLEANUP_PATTERNS)
+            position = clean_text(position, COMPILED_POSITION_CLEANUP_PATTERNS)
 
             # Validate
             if position and 5 <= len(position) <= 60:
@@ -458,24 +476,17 @@ def pattern_match_extraction(email: Dict[str, Any]) -> ExtractionResult:
     # These come from jobs-noreply@linkedin.com with subject like
     # "Your application was sent to [Company]"
     if 'linkedin' in sender.lower():
-        linkedin_company = re.search(
-            r'application was sent to ([^-|\n.]+)', subject, re.IGNORECASE
-        )
+        linkedin_company = _LINKEDIN_COMPANY_RE.search(subject)
         if not linkedin_company:
-            linkedin_company = re.search(
-                r'application was sent to ([^-|\n.]+)', body, re.IGNORECASE
-            )
+            linkedin_company = _LINKEDIN_COMPANY_RE.search(body)
         if linkedin_company:
-            result.company = clean_text(linkedin_company.group(1), COMPANY_CLEANUP_PATTERNS)
+            result.company = clean_text(linkedin_company.group(1), COMPILED_COMPANY_CLEANUP_PATTERNS)
             result.company_source = 'subject'
 
         # Try to extract role from body (LinkedIn often includes it)
-        linkedin_role = re.search(
-            r'(?:applied for|application for)\s+(?:the\s+)?([^-|\n.]+?)(?:\s+at\s+|\s*$)',
-            body, re.IGNORECASE
-        )
+        linkedin_role = _LINKEDIN_ROLE_RE.search(body)
         if linkedin_role:
-            result.position = clean_text(linkedin_role.group(1), POSITION_CLEANUP_PATTERNS)
+            result.position = clean_text(linkedin_role.group(1), COMPILED_POSITION_CLEANUP_PATTERNS)
             result.position_source = 'body'
 
         result.status = 'Applied'
@@ -14,7 +14,12 @@ Categories:
 """
 
 import re
-from typing import List, Dict, Pattern
+from typing import List, Dict, Optional, Pattern, Tuple
+
+try:
+    from re import _parser as _sre_parse
+except ImportError:  # pragma: no cover - private module moved or removed
+    _sre_parse = None
 
 # =============================================================================
 # GENERIC EMAIL PROVIDERS (Skip for company extraction)
@@ -463,6 +468,30 @@ STATUS_PATTERNS: Dict[str, List[str]] = {
     ],
 }
 
+# Phrases that definitively indicate rejection even if "interview" appears
+STRONG_REJECTION_PATTERNS: List[str] = [
+    r'not moving forward',
+    r"won['\u2019]?t be advancing",
+    r"won['\u2019]?t be moving forward",
+    r'will not be moving forward',
+    r'not move forward',
+    r'unfortunately',
+    r'decided to not move forward',
+    r'we are not moving forward',
+    r'wish you.*success.*(?:search|job search)',
+    r'best of luck.*(?:search|job search)',
+]
+
+# Phrases that definitively indicate Applied even if "interview" or
+# "next steps" appear incidentally (e.g., "learn about our interview process")
+STRONG_APPLIED_PATTERNS: List[str] = [
+    r'thank you for (?:your )?(?:applying|application)',
+    r'thanks for applying',
+    r'application (?:has been )?received',
+    r'(?:we )?received your application',
+    r'application (?:has been )?submitted',
+]
+
 # =============================================================================
 # COMPILED PATTERNS (for performance)
 # =============================================================================
@@ -488,6 +517,97 @@ COMPILED_STATUS_PATTERNS: Dict[str, List[Pattern]] = {
     for status, patterns in STATUS_PATTERNS.items()
 }
 
+# Status and strong-phrase patterns are written in lowercase, so classify_status
+# lowercases the email once (see CASEFOLD_EXTRAS) and searches it with
+# case-sensitive patterns, which is several times faster than IGNORECASE.
+COMPILED_STRONG_REJECTION_PATTERNS = compile_patterns(STRONG_REJECTION_PATTERNS, flags=0)
+COMPILED_STRONG_APPLIED_PATTERNS = compile_patterns(STRONG_APPLIED_PATTERNS, flags=0)
+
+
+def _literal_run(items: list) -> Optional[str]:
+    """Return the text of a parsed sequence made only of literals, else None."""
+    if all(op is _sre_parse.LITERAL for op, _ in items):
+        return ''.join(chr(value) for _, value in items)
+    return None
+
+
+def required_literals(pattern: str, min_length: int = 3) -> Tuple[Tuple[str, ...], ...]:
+    """
+    Find lowercase ASCII substrings that every match of pattern contains.
+
+    Each requirement is a tuple of alternatives, at least one of which
+    every match contains: a top-level literal run gives a single
+    alternative, and a top-level alternation of plain literals, such as
+    (?:technical|coding), gives one per branch. Nothing inside optional
+    groups or repeats is used. Plain substring checks for them are much
+    cheaper than running the regex, so they can rule out a search before
+    the regex engine is involved. Longer (more selective) requirements
+    come first.
+
+    Args:
+        pattern: Regex pattern string
+        min_length: Shortest literal worth checking
+
+    Returns:
+        Tuple of requirements; empty if the pattern has no usable literal
+    """
+    if _sre_parse is None:
+        return ()
+
+    try:
+        parsed = _sre_parse.parse(pattern)
+    except re.error:
+        return ()
+
+    def usable(literal: Optional[str]) -> bool:
+        return literal is not None and len(literal) >= min_length and literal.isascii()
+
+    requirements = []
+    current = ''
+    for op, value in list(parsed) + [(None, None)]:
+        if op is _sre_parse.LITERAL:
+            current += chr(value)
+            continue
+
+        if usable(current):
+            requirements.append((current.lower(),))
+        current = ''
+
+        if op is _sre_parse.BRANCH:
+            alternatives = [_literal_run(branch) for branch in value[1]]
+            if all(usable(alternative) for alternative in alternatives):
+                requirements.append(tuple(alternative.lower() for alternative in alternatives))
+
+    requirements.sort(key=lambda alternatives: min(map(len, alternatives)), reverse=True)
+    return tuple(requirements)
+
+
+def has_required_literals(text: str, requirements: Tuple[Tuple[str, ...], ...]) -> bool:
+    """Check that lowercased text meets every requirement from required_literals()."""
+    for alternatives in requirements:
+        for literal in alternatives:
+            if literal in text:
+                break
+        else:
+            return False
+    return True
+
+
+# Case-sensitive status patterns for lowercased text, paired with the
+# literals each match requires
+STATUS_PATTERN_LITERALS: Dict[str, List[Tuple[Tuple[Tuple[str, ...], ...], Pattern]]] = {
+    status: [
+        (required_literals(pattern.pattern), pattern)
+        for pattern in compile_patterns(patterns, flags=0)
+    ]
+    for status, patterns in STATUS_PATTERNS.items()
+}
+
+# Characters IGNORECASE treats as equal to an ASCII letter ('ı' ~ 'i',
+# 'ſ' ~ 's') that survive str.lower(). Translating them after lowercasing
+# makes case-sensitive matching of lowercase patterns equal to IGNORECASE.
+CASEFOLD_EXTRAS = str.maketrans({'\u0131': 'i', '\u017f': 's'})
+
 # =============================================================================
 # SENDER PATTERNS (for identifying job-related emails)
 # =============================================================================
@@ -542,3 +662,13 @@ POSITION_CLEANUP_PATTERNS: List[tuple] = [
     # Remove parenthetical content at end (often location or team)
     (r'\s*\([^)]*\)\s*$', ''),
 ]
+
+# Pre-compiled (pattern, replacement) pairs for clean_text()
+COMPILED_COMPANY_CLEANUP_PATTERNS: List[tuple] = [
+    (re.compile(pattern, re.IGNORECASE), replacement)
+    for pattern, replacement in COMPANY_CLEANUP_PATTERNS
+]
+COMPILED_POSITION_CLEANUP_PATTERNS: List[tuple] = [
+    (re.compile(pattern, re.IGNORECASE), replacement)
+    for pattern, replacement in POSITION_CLEANUP_PATTERNS
+]
@@ -0,0 +1,55 @@
+"""
+Unit tests for the CLI scan helpers.
+
+Tests cover:
+- Worker count selection from advanced settings
+- In-process classification fallback
+"""
+
+from cli import PROCESS_POOL_MIN_EMAILS, classify_in_workers, scan_workers
+
+
+# =============================================================================
+# Worker Count Tests
+# =============================================================================
+
+class TestScanWorkers:
+    """Tests for choosing the classification worker count."""
+
+    def test_parallel_disabled(self):
+        """Without parallel_extraction, large scans stay in-process."""
+        assert scan_workers(PROCESS_POOL_MIN_EMAILS * 10, False, 4) == 1
+
+    def test_small_scan(self):
+        """Scans below the threshold stay in-process."""
+        assert scan_workers(PROCESS_POOL_MIN_EMAILS - 1, True, 4) == 1
+
+    def test_capped_at_max_workers(self, monkeypatch):
+        """Worker count never exceeds max_workers."""
+        monkeypatch.setattr("cli.os.cpu_count", lambda: 16)
+        assert scan_workers(PROCESS_POOL_MIN_EMAILS, True, 4) == 4
+
+    def test_capped_at_cpu_count(self, monkeypatch):
+        """Worker count never exceeds the CPU count."""
+        monkeypatch.setattr("cli.os.cpu_count", lambda: 2)
+        assert scan_workers(PROCESS_POOL_MIN_EMAILS, True, 4) == 2
+
+
+# =============================================================================
+# Classification Tests
+# =============================================================================
+
+class TestClassifyInWorkers:
+    """Tests for pairing emails with worker extractions."""
+
+    def test_single_worker_yields_none_in_order(self):
+        """One worker classifies nothing and keeps input order."""
+        emails = [object() for _ in range(5)]
+        pairs = list(classify_in_workers(iter(emails), 1))
+
+        assert [email for email, _ in pairs] == emails
+        assert all(extraction is None for _, extraction in pairs)
+
+    def test_empty_input(self):
+        """No emails yields nothing."""
+        assert list(classify_in_workers(iter([]), 1)) == []
@@ -0,0 +1,208 @@
+"""
+Unit tests for the auth module.
+
+Tests cover:
+- Cached auth status reuse and invalidation
+- Owner-only, atomic writes of the status cache
+- Gmail service reuse until the credentials are due for refresh
+"""
+
+import json
+import os
+import stat
+import sys
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from core import auth
+from core.auth import (
+    AUTH_STATUS_TTL_SECONDS,
+    REFRESH_SKEW_SECONDS,
+    check_auth_status,
+    clear_service_cache,
+    get_gmail_service,
+    get_gmail_session,
+)
+
+
+CACHED_STATUS = {
+    "authenticated": True,
+    "email": "me@example.com",
+    "token_exists": True,
+    "token_valid": True,
+    "token_expired": False,
+}
+
+
+@pytest.fixture
+def token_path(tmp_path):
+    """A token file that cannot be loaded, so only a cache hit authenticates."""
+    path = tmp_path / "token.json"
+    path.write_text("not a token")
+    return path
+
+
+def cache_status(token_path) -> None:
+    """Cache CACHED_STATUS for the token as it is now."""
+    auth._write_cached_status(token_path, token_path.stat().st_mtime_ns, CACHED_STATUS)
+
+
+# =============================================================================
+# Cached Status Tests
+# =============================================================================
+
+class TestCachedAuthStatus:
+    """Tests for reusing check_auth_status() results."""
+
+    def test_fresh_cache_is_used(self, token_path):
+        """A recent status for an unchanged token is returned as cached."""
+        cache_status(token_path)
+        assert check_auth_status(token_path) == CACHED_STATUS
+
+    def test_changed_token_invalidates(self, token_path):
+        """A token with a different mtime is checked again."""
+        cache_status(token_path)
+        mtime_ns = token_path.stat().st_mtime_ns
+        os.utime(token_path, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+
+        result = check_auth_status(token_path)
+        assert result["authenticated"] is False
+        assert result["email"] is None
+
+    def test_expired_ttl_invalidates(self, token_path, monkeypatch):
+        """A status older than AUTH_STATUS_TTL_SECONDS is checked again."""
+        cache_status(token_path)
+        now = auth.time.time()
+        monkeypatch.setattr(auth.time, "time", lambda: now + AUTH_STATUS_TTL_SECONDS + 1)
+
+        assert check_auth_status(token_path)["authenticated"] is False
+
+    def test_missing_token_ignores_cache(self, token_path):
+        """Without a token the cache is not consulted."""
+        cache_status(token_path)
+        token_path.unlink()
+
+        result = check_auth_status(token_path)
+        assert result["token_exists"] is False
+        assert result["authenticated"] is False
+
+    def test_unreadable_cache_ignored(self, token_path):
+        """A corrupt cache file counts as a miss."""
+        auth._status_cache_path(token_path).write_text("{not json")
+        assert check_auth_status(token_path)["authenticated"] is False
+
+
+# =============================================================================
+# Status File Tests
+# =============================================================================
+
+class TestStatusFile:
+    """Tests for how the status cache is written."""
+
+    def test_contents(self, token_path):
+        """The cache records the token mtime and the status."""
+        cache_status(token_path)
+        cached = json.loads(auth._status_cache_path(token_path).read_text())
+
+        assert cached["token_mtime_ns"] == token_path.stat().st_mtime_ns
+        assert cached["status"] == CACHED_STATUS
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+    def test_owner_only(self, token_path):
+        """The cache file is mode 0600 and no temporary file is left."""
+        cache_status(token_path)
+        path = auth._status_cache_path(token_path)
+
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+        assert not path.with_name(path.name + ".tmp").exists()
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+    def test_replaces_world_readable_file(self, token_path):
+        """An existing world-readable cache is replaced by an owner-only one."""
+        path = auth._status_cache_path(token_path)
+        path.write_text("{}")
+        os.chmod(path, 0o644)
+
+        cache_status(token_path)
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+
+# =============================================================================
+# Service Cache Tests
+# =============================================================================
+
+class FakeCredentials:
+    """Credentials expiring a given number of seconds from now."""
+
+    def __init__(self, expires_in: float):
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        self.expiry = now + timedelta(seconds=expires_in)
+        self.expired = expires_in <= 0
+        self.valid = not self.expired
+        self.refresh_token = "refresh"
+
+
+class TestServiceCache:
+    """Tests for reusing services built by get_gmail_service()."""
+
+    @pytest.fixture(autouse=True)
+    def fake_auth(self, monkeypatch, tmp_path):
+        """Hand out credentials from self.creds and count loads and builds."""
+        self.creds = []
+        self.loads = []
+
+        def get_credentials(credentials_path, token_path, force_refresh=False):
+            self.loads.append(force_refresh)
+            return self.creds.pop(0)
+
+        monkeypatch.setattr(auth, "get_credentials", get_credentials)
+        monkeypatch.setattr(auth, "_build_service", lambda creds: ("service", creds))
+        self.paths = (tmp_path / "credentials.json", tmp_path / "token.json")
+        clear_service_cache()
+        yield
+        clear_service_cache()
+
+    def test_fresh_credentials_reused(self):
+        """A service whose credentials are not due for refresh is reused."""
+        self.creds = [FakeCredentials(3600)]
+
+        first = get_gmail_service(*self.paths)
+        assert get_gmail_service(*self.paths) is first
+        assert self.loads == [False]
+
+    def test_expiring_credentials_reloaded(self):
+        """Credentials within REFRESH_SKEW_SECONDS of expiry go through get_credentials."""
+        expiring = FakeCredentials(REFRESH_SKEW_SECONDS / 2)
+        renewed = FakeCredentials(3600)
+        self.creds = [expiring, renewed]
+
+        assert get_gmail_service(*self.paths) == ("service", expiring)
+        assert get_gmail_service(*self.paths) == ("service", renewed)
+        assert len(self.loads) == 2
+
+    def test_expired_credentials_reloaded(self):
+        """Expired credentials are never reused even with a refresh token."""
+        expired = FakeCredentials(-60)
+        renewed = FakeCredentials(3600)
+        self.creds = [expired, renewed]
+
+        get_gmail_service(*self.paths)
+        assert get_gmail_service(*self.paths) == ("service", renewed)
+
+    def test_force_refresh_skips_cache(self):
+        """force_refresh always goes through get_credentials."""
+        self.creds = [FakeCredentials(3600), FakeCredentials(3600)]
+
+        get_gmail_service(*self.paths)
+        get_gmail_service(*self.paths, force_refresh=True)
+        assert self.loads == [False, True]
+
+    def test_session_returns_credentials(self):
+        """get_gmail_session returns the credentials the service was built with."""
+        creds = FakeCredentials(3600)
+        self.creds = [creds]
+
+        assert get_gmail_session(*self.paths) == (creds, ("service", creds))
+        assert get_gmail_session(*self.paths) == (creds, ("service", creds))
+        assert self.loads == [False]
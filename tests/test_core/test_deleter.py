@@ -0,0 +1,399 @@
+"""
+Unit tests for the deleter module.
+
+Tests cover:
+- Deletion rules and their order in should_delete_email
+- Safety keyword matching
+- Limiting the keyword scan with scan_chars
+- Aho-Corasick keyword matching parity with the per-keyword loop
+- Audit logging and batch files for emails that failed to trash
+"""
+
+import json
+import random
+
+import pytest
+
+from core import deleter
+from core.deleter import (
+    DEFAULT_SAFETY_KEYWORDS,
+    SCAN_TAIL_CHARS,
+    DeletionResult,
+    EmailDeleter,
+    _scan_window,
+    contains_safety_keyword,
+    should_delete_email,
+)
+
+
+PLAIN_TEXT = "Thanks for your note. We have received it."
+KEYWORD_TEXT = "Please complete the coding challenge by Friday."
+
+
+# =============================================================================
+# Deletion Rule Tests
+# =============================================================================
+
+class TestShouldDeleteEmail:
+    """Tests for each deletion rule, in the order they apply."""
+
+    def test_rule1_interviewing_kept(self):
+        """Rule 1: Interviewing is kept by default."""
+        result = should_delete_email("Interviewing", PLAIN_TEXT)
+        assert result == DeletionResult(False, "Status is Interviewing (always kept)")
+
+    def test_rule2_offer_kept(self):
+        """Rule 2: Offer is kept by default."""
+        result = should_delete_email("Offer", PLAIN_TEXT)
+        assert result == DeletionResult(False, "Status is Offer (always kept)")
+
+    def test_rule3_conflict_kept(self):
+        """Rule 3: emails that created a conflict are kept."""
+        result = should_delete_email("Applied", PLAIN_TEXT, is_conflict=True)
+        assert result == DeletionResult(False, "Email created status conflict (requires review)")
+
+    def test_rule3_conflict_allowed_when_disabled(self):
+        """Rule 3 can be turned off."""
+        result = should_delete_email(
+            "Applied", PLAIN_TEXT, is_conflict=True, never_delete_conflicts=False
+        )
+        assert result.should_delete is True
+
+    def test_rule4_starred_kept(self):
+        """Rule 4: starred emails are kept."""
+        result = should_delete_email("Rejected", PLAIN_TEXT, is_starred=True)
+        assert result == DeletionResult(False, "Email is starred (protected)")
+
+    def test_rule4_starred_allowed_when_disabled(self):
+        """Rule 4 can be turned off."""
+        result = should_delete_email(
+            "Rejected", PLAIN_TEXT, is_starred=True, never_delete_starred=False
+        )
+        assert result.should_delete is True
+
+    def test_rule5_attachments_allowed_by_default(self):
+        """Rule 5 is off by default."""
+        result = should_delete_email("Applied", PLAIN_TEXT, has_attachments=True)
+        assert result.should_delete is True
+
+    def test_rule5_attachments_kept_when_enabled(self):
+        """Rule 5: attachments protect the email when enabled."""
+        result = should_delete_email(
+            "Applied", PLAIN_TEXT, has_attachments=True, never_delete_with_attachments=True
+        )
+        assert result == DeletionResult(False, "Email has attachments (protected)")
+
+    @pytest.mark.parametrize("status", ["Applied", "Rejected"])
+    def test_rule6_safety_keyword_kept(self, status):
+        """Rule 6: a safety keyword keeps a deletable email."""
+        result = should_delete_email(status, KEYWORD_TEXT)
+        assert result == DeletionResult(
+            False, "Contains safety keyword: 'coding challenge'", "coding challenge"
+        )
+
+    def test_rule6_custom_keywords(self):
+        """Rule 6 uses the given keyword list instead of the defaults."""
+        result = should_delete_email("Applied", "Your parking permit", safety_keywords=["permit"])
+        assert result == DeletionResult(False, "Contains safety keyword: 'permit'", "permit")
+
+        result = should_delete_email("Applied", KEYWORD_TEXT, safety_keywords=["permit"])
+        assert result.should_delete is True
+
+    def test_rule7_applied_deleted(self):
+        """Rule 7: Applied without protections is deleted."""
+        result = should_delete_email("Applied", PLAIN_TEXT)
+        assert result == DeletionResult(True, "Status is Applied (safe to delete)")
+
+    def test_rule8_rejected_deleted(self):
+        """Rule 8: Rejected without protections is deleted."""
+        result = should_delete_email("Rejected", PLAIN_TEXT)
+        assert result == DeletionResult(True, "Status is Rejected (safe to delete)")
+
+    @pytest.mark.parametrize("status,flags", [
+        ("Applied", {"delete_applied": False}),
+        ("Rejected", {"delete_rejected": False}),
+        ("Interviewing", {"delete_interviewing": True}),
+        ("Offer", {"delete_offer": True}),
+        ("Unknown", {}),
+    ])
+    def test_not_configured_for_deletion(self, status, flags):
+        """Statuses not enabled for deletion are kept."""
+        result = should_delete_email(status, PLAIN_TEXT, **flags)
+        assert result == DeletionResult(False, f"Status is {status} (not configured for deletion)")
+
+    @pytest.mark.parametrize("status,flags", [
+        ("Applied", {"delete_applied": False}),
+        ("Interviewing", {"delete_interviewing": True}),
+        ("Unknown", {}),
+    ])
+    def test_non_deletable_status_with_keyword(self, status, flags):
+        """A non-deletable status is kept for its status, before any keyword scan."""
+        result = should_delete_email(status, KEYWORD_TEXT, **flags)
+        assert result == DeletionResult(False, f"Status is {status} (not configured for deletion)")
+        assert result.safety_keyword is None
+
+    def test_protections_before_keywords(self):
+        """Rules 1-5 report their own reason even when a keyword is present."""
+        assert should_delete_email("Offer", KEYWORD_TEXT).reason == "Status is Offer (always kept)"
+        assert should_delete_email(
+            "Applied", KEYWORD_TEXT, is_starred=True
+        ).reason == "Email is starred (protected)"
+
+    def test_rule_order(self):
+        """Earlier rules win when several apply."""
+        result = should_delete_email("Interviewing", PLAIN_TEXT, is_conflict=True, is_starred=True)
+        assert result.reason == "Status is Interviewing (always kept)"
+
+        result = should_delete_email("Applied", PLAIN_TEXT, is_conflict=True, is_starred=True)
+        assert result.reason == "Email created status conflict (requires review)"
+
+    def test_precomputed_lowercase_text(self):
+        """email_text_lower is used for the keyword scan when given."""
+        text = "Your INTERVIEW details"
+        result = should_delete_email("Applied", text, email_text_lower=text.lower())
+        assert result.safety_keyword == "interview"
+
+
+# =============================================================================
+# Safety Keyword Tests
+# =============================================================================
+
+class TestContainsSafetyKeyword:
+    """Tests for safety keyword matching."""
+
+    def test_no_keyword(self):
+        """Text without keywords is not flagged."""
+        assert contains_safety_keyword(PLAIN_TEXT) == (False, None)
+
+    def test_case_insensitive(self):
+        """Keywords match regardless of case."""
+        assert contains_safety_keyword("Your JOB OFFER") == (True, "offer")
+
+    def test_first_in_list_order(self):
+        """The keyword reported is the first in list order, not in text order."""
+        text = "Reset your password"
+        assert DEFAULT_SAFETY_KEYWORDS.index("password") < DEFAULT_SAFETY_KEYWORDS.index("reset")
+        assert contains_safety_keyword(text) == (True, "password")
+
+    def test_substring_match(self):
+        """Keywords match inside longer words."""
+        assert contains_safety_keyword("Contested", ["test"]) == (True, "test")
+
+    def test_empty_keyword_list(self):
+        """An empty list flags nothing."""
+        assert contains_safety_keyword(KEYWORD_TEXT, []) == (False, None)
+
+    def test_text_lower_used(self):
+        """A given text_lower is searched instead of lowercasing text."""
+        assert contains_safety_keyword("unrelated", ["offer"], text_lower="offer") == (True, "offer")
+
+
+# =============================================================================
+# Scan Window Tests
+# =============================================================================
+
+class TestScanWindow:
+    """Tests for limiting the keyword scan to the head and tail of the text."""
+
+    SCAN_CHARS = 100
+    FILLER = "x"
+
+    def padded(self, head: str = "", middle: str = "", tail: str = "") -> str:
+        """Text long enough that its middle is outside the scan window."""
+        pad = self.FILLER * (self.SCAN_CHARS + SCAN_TAIL_CHARS)
+        return f"{head}{pad}{middle}{pad}{tail}"
+
+    def decide(self, text: str, **kwargs) -> DeletionResult:
+        return should_delete_email("Applied", text, scan_chars=self.SCAN_CHARS, **kwargs)
+
+    def test_keyword_at_start(self):
+        """A keyword in the first scan_chars characters is found."""
+        result = self.decide(self.padded(head="interview "))
+        assert result.safety_keyword == "interview"
+
+    def test_keyword_in_tail(self):
+        """A keyword in the last SCAN_TAIL_CHARS characters is found."""
+        result = self.decide(self.padded(tail=" interview"))
+        assert result.safety_keyword == "interview"
+
+    def test_keyword_in_skipped_middle(self):
+        """A keyword between the head and tail is not searched."""
+        text = self.padded(middle=" interview ")
+        assert self.decide(text).should_delete is True
+        assert should_delete_email("Applied", text).safety_keyword == "interview"
+
+    def test_zero_searches_everything(self):
+        """scan_chars=0 searches the whole text."""
+        text = self.padded(middle=" interview ")
+        assert should_delete_email("Applied", text, scan_chars=0).safety_keyword == "interview"
+
+    def test_exact_boundary_length_unchanged(self):
+        """Text of exactly scan_chars + SCAN_TAIL_CHARS is searched whole."""
+        text = "a" * (self.SCAN_CHARS + SCAN_TAIL_CHARS)
+        assert _scan_window(text, self.SCAN_CHARS) is text
+
+    def test_one_past_boundary_windowed(self):
+        """One character more drops the character between head and tail."""
+        text = "h" * self.SCAN_CHARS + "m" + "t" * SCAN_TAIL_CHARS
+        window = _scan_window(text, self.SCAN_CHARS)
+        assert window == "h" * self.SCAN_CHARS + "\n" + "t" * SCAN_TAIL_CHARS
+
+    def test_keyword_not_joined_across_cut(self):
+        """Head and tail are separated, so a keyword cannot span the cut."""
+        text = "a" * (self.SCAN_CHARS - 3) + "off" + "m" * 10 + "er" + "b" * (SCAN_TAIL_CHARS - 2)
+        assert contains_safety_keyword(_scan_window(text, self.SCAN_CHARS), ["offer"]) == (False, None)
+
+    def test_text_lower_windowed_like_text(self):
+        """email_text_lower is limited the same way as email_text."""
+        text = self.padded(middle=" INTERVIEW ")
+        result = self.decide(text, email_text_lower=text.lower())
+        assert result == self.decide(text)
+        assert result.should_delete is True
+
+        text = self.padded(tail=" INTERVIEW")
+        assert self.decide(text, email_text_lower=text.lower()).safety_keyword == "interview"
+
+
+# =============================================================================
+# Aho-Corasick Parity Tests
+# =============================================================================
+
+class TestKeywordAutomaton:
+    """Tests that the optional automaton reports what the loop reports."""
+
+    @pytest.fixture(autouse=True)
+    def require_ahocorasick(self):
+        pytest.importorskip("ahocorasick")
+
+    def loop_result(self, monkeypatch, text, keywords):
+        """contains_safety_keyword with the automaton disabled."""
+        with monkeypatch.context() as patch:
+            patch.setattr(deleter, "_keyword_automaton", lambda safety_keywords: None)
+            return contains_safety_keyword(text, keywords)
+
+    def assert_parity(self, monkeypatch, text, keywords):
+        assert deleter._keyword_automaton(tuple(keywords)) is not None
+        expected = self.loop_result(monkeypatch, text, keywords)
+        assert contains_safety_keyword(text, keywords) == expected
+        return expected
+
+    def test_first_in_list_order(self, monkeypatch):
+        """The first keyword in list order wins, wherever it is in the text."""
+        keywords = ["zebra", "offer", "apple"]
+        text = "apple then offer then zebra"
+        assert self.assert_parity(monkeypatch, text, keywords) == (True, "zebra")
+
+    def test_mixed_case_keywords(self, monkeypatch):
+        """Mixed-case keywords match any case and are reported as written."""
+        keywords = ["Job Offer", "SALARY"]
+        assert self.assert_parity(monkeypatch, "your salary and JOB offer", keywords) == (
+            True, "Job Offer"
+        )
+
+    def test_duplicate_keywords(self, monkeypatch):
+        """Keywords equal after lowercasing report the first spelling."""
+        keywords = ["deadline", "Offer", "offer", "OFFER"]
+        assert self.assert_parity(monkeypatch, "an offer", keywords) == (True, "Offer")
+
+    def test_overlapping_keywords(self, monkeypatch):
+        """A keyword inside another still counts in list order."""
+        keywords = ["offer letter", "offer", "letter"]
+        assert self.assert_parity(monkeypatch, "the letter", keywords) == (True, "letter")
+        assert self.assert_parity(monkeypatch, "offer letter", keywords) == (True, "offer letter")
+
+    def test_no_match(self, monkeypatch):
+        """Text without keywords matches nothing."""
+        assert self.assert_parity(monkeypatch, PLAIN_TEXT, list(DEFAULT_SAFETY_KEYWORDS)) == (
+            False, None
+        )
+
+    def test_empty_keyword_falls_back(self):
+        """Lists that are empty or contain an empty keyword use the loop."""
+        assert deleter._keyword_automaton(("offer", "")) is None
+        assert deleter._keyword_automaton(()) is None
+
+    def test_randomized_parity(self, monkeypatch):
+        """Default keywords agree with the loop on random text."""
+        rng = random.Random(7)
+        words = ["thanks", "for", "applying", "we", "will", "review", "Ünïcode", "İstanbul"]
+        keywords = list(DEFAULT_SAFETY_KEYWORDS)
+        for _ in range(300):
+            parts = [rng.choice(words) for _ in range(rng.randint(0, 30))]
+            for _ in range(rng.randint(0, 3)):
+                keyword = rng.choice(keywords)
+                parts.insert(rng.randint(0, len(parts)), rng.choice([keyword, keyword.upper()]))
+            self.assert_parity(monkeypatch, " ".join(parts), keywords)
+
+
+# =============================================================================
+# Batch Deletion Tests
+# =============================================================================
+
+class FakeGmailClient:
+    """Gmail client whose trash_emails_batch() fails the given IDs."""
+
+    def __init__(self, failed_ids):
+        self.failed_ids = list(failed_ids)
+        self.trashed = []
+
+    def trash_emails_batch(self, email_ids, delay=0.1, progress_callback=None):
+        self.trashed.append(list(email_ids))
+        return len(email_ids) - len(self.failed_ids), self.failed_ids
+
+
+EMAILS = [
+    ("m1", "Acme", "Applied", "Thanks for applying"),
+    ("m2", "Globex", "Rejected", "Update on your application"),
+    ("m3", "Initech", "Applied", "Application received"),
+]
+
+
+class TestDeleteEmails:
+    """Tests for EmailDeleter.delete_emails()."""
+
+    @pytest.fixture
+    def audit(self, monkeypatch):
+        """Capture audit log calls instead of writing the deletion log."""
+        calls = {"deleted": [], "complete": []}
+        monkeypatch.setattr(
+            deleter, "log_deletion",
+            lambda email_id, company, status, subject: calls["deleted"].append(email_id),
+        )
+        monkeypatch.setattr(deleter, "log_deletion_batch_start", lambda total: None)
+        monkeypatch.setattr(
+            deleter, "log_deletion_batch_complete",
+            lambda deleted, failed=0: calls["complete"].append((deleted, failed)),
+        )
+        return calls
+
+    def test_failed_ids_left_out_of_audit_log(self, audit, tmp_path):
+        """Only emails that were really trashed are logged as deleted."""
+        client = FakeGmailClient(failed_ids=["m2"])
+
+        result = EmailDeleter(client, log_directory=tmp_path).delete_emails(EMAILS, delay=0)
+
+        assert client.trashed == [["m1", "m2", "m3"]]
+        assert audit["deleted"] == ["m1", "m3"]
+        assert audit["complete"] == [(2, 1)]
+        assert (result.deleted_count, result.failed_count, result.failed_ids) == (2, 1, ["m2"])
+
+    def test_failed_ids_recorded_in_batch_file(self, audit, tmp_path):
+        """The batch file lists every email and records the failed ones."""
+        deleter_ = EmailDeleter(FakeGmailClient(failed_ids=["m2"]), log_directory=tmp_path)
+
+        result = deleter_.delete_emails(EMAILS, delay=0)
+        batch = json.loads((tmp_path / f"batch_{result.batch_id}.json").read_text())
+
+        assert batch["email_ids"] == ["m1", "m2", "m3"]
+        assert batch["failed_ids"] == ["m2"]
+        assert (batch["deleted_count"], batch["failed_count"]) == (2, 1)
+        assert deleter_.get_last_batch() == batch
+
+    def test_all_trashed(self, audit, tmp_path):
+        """With no failures every email is logged and none recorded as failed."""
+        result = EmailDeleter(FakeGmailClient(failed_ids=[]), log_directory=tmp_path).delete_emails(
+            EMAILS, delay=0
+        )
+
+        assert audit["deleted"] == ["m1", "m2", "m3"]
+        assert result.failed_ids == []
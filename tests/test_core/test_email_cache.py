@@ -0,0 +1,179 @@
+"""
+Unit tests for the email content cache.
+
+Tests cover:
+- Round trips through put_many/get_many
+- Lookups larger than one SQLite query
+- TTL eviction when the cache opens
+- File permissions and closing
+"""
+
+import os
+import sqlite3
+import stat
+import sys
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from core.email_cache import MAX_QUERY_IDS, CachedContent, EmailCache
+
+
+def make_content(n: int, date=None) -> CachedContent:
+    """Build distinguishable cached content."""
+    return CachedContent(
+        subject=f"Subject {n}",
+        sender=f"jobs{n}@example.com",
+        body=f"Body {n} — thank you for applying",
+        snippet=f"Snippet {n}",
+        date=date,
+        has_attachments=n % 2 == 0,
+    )
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return tmp_path / "cache" / "emails.sqlite3"
+
+
+def age_entries(path, seconds: float) -> None:
+    """Move every entry's last use back by seconds."""
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.execute("UPDATE emails SET used_at = used_at - ?", (seconds,))
+    conn.close()
+
+
+# =============================================================================
+# Round Trip Tests
+# =============================================================================
+
+class TestRoundTrip:
+    """Tests for storing and reading cached content."""
+
+    def test_put_then_get(self, cache_path):
+        """Stored content reads back field for field."""
+        date = datetime(2024, 3, 1, 9, 30, tzinfo=timezone.utc)
+        with EmailCache(cache_path) as cache:
+            cache.put_many([("a", make_content(1, date)), ("b", make_content(2))])
+            found = cache.get_many(["a", "b"])
+
+        assert found == {"a": make_content(1, date), "b": make_content(2)}
+
+    def test_missing_ids_are_omitted(self, cache_path):
+        """IDs that were never stored are not in the result."""
+        with EmailCache(cache_path) as cache:
+            cache.put_many([("a", make_content(1))])
+            assert cache.get_many(["a", "missing"]) == {"a": make_content(1)}
+            assert cache.get_many([]) == {}
+
+    def test_put_replaces(self, cache_path):
+        """Storing an ID again replaces its content."""
+        with EmailCache(cache_path) as cache:
+            cache.put_many([("a", make_content(1))])
+            cache.put_many([("a", make_content(2))])
+            assert cache.get_many(["a"]) == {"a": make_content(2)}
+
+    def test_persists_across_opens(self, cache_path):
+        """Entries survive closing and reopening the cache."""
+        with EmailCache(cache_path) as cache:
+            cache.put_many([("a", make_content(1))])
+        with EmailCache(cache_path) as cache:
+            assert cache.get_many(["a"]) == {"a": make_content(1)}
+
+    def test_clear(self, cache_path):
+        """clear() removes every entry."""
+        with EmailCache(cache_path) as cache:
+            cache.put_many([("a", make_content(1))])
+            cache.clear()
+            assert cache.get_many(["a"]) == {}
+
+    def test_get_many_above_query_limit(self, cache_path):
+        """Lookups of more than MAX_QUERY_IDS IDs are split across queries."""
+        ids = [f"m{n}" for n in range(MAX_QUERY_IDS * 2 + 5)]
+        with EmailCache(cache_path) as cache:
+            cache.put_many((email_id, make_content(n)) for n, email_id in enumerate(ids))
+            found = cache.get_many(ids + ["missing"])
+
+        assert len(found) == len(ids)
+        assert found[ids[0]] == make_content(0)
+        assert found[ids[-1]] == make_content(len(ids) - 1)
+
+
+# =============================================================================
+# TTL Tests
+# =============================================================================
+
+class TestTTL:
+    """Tests for evicting unused entries."""
+
+    def test_expired_entries_evicted_on_open(self, cache_path):
+        """Entries unused for longer than the TTL are gone after reopening."""
+        with EmailCache(cache_path, ttl_hours=1) as cache:
+            cache.put_many([("a", make_content(1))])
+        age_entries(cache_path, 2 * 3600)
+
+        with EmailCache(cache_path, ttl_hours=1) as cache:
+            assert cache.get_many(["a"]) == {}
+
+    def test_recent_entries_kept(self, cache_path):
+        """Entries used within the TTL are kept."""
+        with EmailCache(cache_path, ttl_hours=3) as cache:
+            cache.put_many([("a", make_content(1))])
+        age_entries(cache_path, 2 * 3600)
+
+        with EmailCache(cache_path, ttl_hours=3) as cache:
+            assert cache.get_many(["a"]) == {"a": make_content(1)}
+
+    def test_read_refreshes_last_use(self, cache_path):
+        """Reading an entry resets its age."""
+        with EmailCache(cache_path, ttl_hours=1) as cache:
+            cache.put_many([("a", make_content(1))])
+        age_entries(cache_path, 3000)
+
+        with EmailCache(cache_path, ttl_hours=1) as cache:
+            assert "a" in cache.get_many(["a"])
+        age_entries(cache_path, 3000)
+
+        with EmailCache(cache_path, ttl_hours=1) as cache:
+            assert "a" in cache.get_many(["a"])
+
+    def test_zero_ttl_evicts_everything(self, cache_path):
+        """A TTL of zero keeps nothing between opens."""
+        with EmailCache(cache_path, ttl_hours=0) as cache:
+            cache.put_many([("a", make_content(1))])
+        time.sleep(0.01)
+
+        with EmailCache(cache_path, ttl_hours=0) as cache:
+            assert cache.get_many(["a"]) == {}
+
+
+# =============================================================================
+# File Tests
+# =============================================================================
+
+class TestCacheFile:
+    """Tests for the database file itself."""
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+    def test_new_file_is_owner_only(self, cache_path):
+        """A new cache database is created with mode 0600."""
+        EmailCache(cache_path).close()
+        assert stat.S_IMODE(os.stat(cache_path).st_mode) == 0o600
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+    def test_existing_file_is_tightened(self, cache_path):
+        """An existing world-readable cache database is made owner-only."""
+        EmailCache(cache_path).close()
+        os.chmod(cache_path, 0o644)
+
+        EmailCache(cache_path).close()
+        assert stat.S_IMODE(os.stat(cache_path).st_mode) == 0o600
+
+    def test_context_manager_closes(self, cache_path):
+        """Leaving the with block closes the connection."""
+        with EmailCache(cache_path) as cache:
+            pass
+        with pytest.raises(sqlite3.ProgrammingError):
+            cache.get_many(["a"])
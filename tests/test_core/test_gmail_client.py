@@ -0,0 +1,542 @@
+"""
+Unit tests for fetching emails with the Gmail client.
+
+Tests cover:
+- Sliding-window fetching that yields in request order
+- Messages that fail individually
+- Per-message and whole-batch HTTP 429 retries
+- Cached messages fetched in minimal format
+- Script and style stripping for HTML-only bodies
+- Trashing and restoring with batchModify and the per-message fallback
+- Per-thread HTTP clients built from the given credentials
+
+The Gmail service is replaced by a fake that answers batch requests from
+canned messages, so no network or real credentials are involved.
+"""
+
+import base64
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+from core.email_cache import CachedContent
+from core.gmail_client import GmailClient, _strip_script_style
+
+
+def http_error(status: int) -> HttpError:
+    """Build an HttpError with the given status."""
+    return HttpError(httplib2.Response({"status": status}), b"error")
+
+
+def make_message(email_id: str) -> dict:
+    """Build a full-format Gmail message for an ID."""
+    body = base64.urlsafe_b64encode(f"Body of {email_id}".encode()).decode()
+    return {
+        "id": email_id,
+        "snippet": f"Snippet {email_id}",
+        "labelIds": ["INBOX"],
+        "payload": {
+            "mimeType": "text/plain",
+            "headers": [
+                {"name": "Subject", "value": f"Subject {email_id}"},
+                {"name": "From", "value": "jobs@example.com"},
+                {"name": "Date", "value": "Mon, 4 Mar 2024 10:00:00 +0000"},
+            ],
+            "body": {"data": body},
+        },
+    }
+
+
+class FakeBatch:
+    """Batch request that answers each message from the fake service."""
+
+    def __init__(self, service: "FakeService", callback):
+        self.service = service
+        self.callback = callback
+        self.requests: list[tuple[str, dict]] = []
+
+    def add(self, request: dict, request_id: str) -> None:
+        self.requests.append((request_id, request))
+
+    def execute(self, http=None) -> None:
+        error = self.service.next_batch_error()
+        if error is not None:
+            raise error
+
+        # Finish batches out of order so in-order yielding is exercised
+        time.sleep(random.random() * self.service.max_delay)
+
+        for request_id, request in self.requests:
+            self.service.record(request_id, request)
+            outcome = self.service.next_outcome(request_id)
+            if outcome is None:
+                self.callback(request_id, make_message(request_id), None)
+            else:
+                self.callback(request_id, None, http_error(outcome))
+
+
+class FakeModifyRequest:
+    """batchModify request that records its body when executed."""
+
+    def __init__(self, service: "FakeService", body: dict):
+        self.service = service
+        self.body = body
+
+    def execute(self) -> dict:
+        error = self.service.next_modify_error(self.body)
+        if error is not None:
+            raise error
+        return {}
+
+
+class FakeService:
+    """
+    Stand-in for the Gmail API resource.
+
+    outcomes maps a message ID to HTTP statuses returned for its first
+    requests, in order; later requests succeed. batch_errors lists statuses
+    raised by whole batch executions before they start succeeding, and
+    modify_errors does the same for batchModify calls.
+    """
+
+    def __init__(
+        self,
+        outcomes=None,
+        batch_errors=None,
+        modify_errors=None,
+        max_delay: float = 0.0,
+    ):
+        self.outcomes = {key: list(value) for key, value in (outcomes or {}).items()}
+        self.batch_errors = list(batch_errors or [])
+        self.modify_errors = list(modify_errors or [])
+        self.max_delay = max_delay
+        self.requested: list[tuple[str, str]] = []
+        self.modify_calls: list[dict] = []
+        self.batch_executions = 0
+        self._lock = threading.Lock()
+
+    # googleapiclient-style request builders
+
+    def users(self):
+        return self
+
+    def messages(self):
+        return self
+
+    def get(self, **kwargs) -> dict:
+        return kwargs
+
+    def trash(self, **kwargs) -> dict:
+        return {"method": "trash", **kwargs}
+
+    def untrash(self, **kwargs) -> dict:
+        return {"method": "untrash", **kwargs}
+
+    def batchModify(self, userId: str, body: dict) -> FakeModifyRequest:
+        return FakeModifyRequest(self, body)
+
+    def new_batch_http_request(self, callback) -> FakeBatch:
+        return FakeBatch(self, callback)
+
+    # Bookkeeping used by FakeBatch
+
+    def next_batch_error(self):
+        with self._lock:
+            self.batch_executions += 1
+            if self.batch_errors:
+                return http_error(self.batch_errors.pop(0))
+        return None
+
+    def next_outcome(self, email_id: str):
+        with self._lock:
+            statuses = self.outcomes.get(email_id)
+            return statuses.pop(0) if statuses else None
+
+    def next_modify_error(self, body: dict):
+        with self._lock:
+            self.modify_calls.append(body)
+            if self.modify_errors:
+                return http_error(self.modify_errors.pop(0))
+        return None
+
+    def record(self, email_id: str, request: dict) -> None:
+        """Record a batched request as (ID, format) or (ID, method)."""
+        with self._lock:
+            self.requested.append((email_id, request.get("format", request.get("method"))))
+
+
+class FakeCache:
+    """In-memory stand-in for EmailCache."""
+
+    def __init__(self, entries=None):
+        self.entries = dict(entries or {})
+
+    def get_many(self, email_ids):
+        return {
+            email_id: self.entries[email_id] for email_id in email_ids if email_id in self.entries
+        }
+
+    def put_many(self, entries):
+        self.entries.update(entries)
+
+
+# Stands in for google.oauth2 credentials; the fake batches never use it
+CREDENTIALS = object()
+
+
+def make_client(service, cache=None, batch_size: int = 3, max_workers: int = 2) -> GmailClient:
+    """Build a client that never sleeps between requests or retries."""
+    client = GmailClient(
+        service,
+        batch_size=batch_size,
+        requests_per_second=0,
+        max_workers=max_workers,
+        cache=cache,
+        credentials=CREDENTIALS,
+    )
+    client._backoff = lambda attempt: None
+    return client
+
+
+IDS = [f"m{n:02d}" for n in range(20)]
+
+
+# =============================================================================
+# Ordering Tests
+# =============================================================================
+
+class TestFetchOrder:
+    """Tests for yielding emails in request order."""
+
+    def test_order_preserved_across_windows(self):
+        """Batches finishing out of order are still yielded in request order."""
+        random.seed(3)
+        client = make_client(FakeService(max_delay=0.01), batch_size=3, max_workers=2)
+
+        emails = list(client.fetch_emails(IDS))
+
+        assert [email.id for email in emails] == IDS
+        assert emails[0].subject == "Subject m00"
+        assert emails[0].body == "Body of m00"
+
+    def test_progress_reaches_total(self):
+        """The progress callback ends at (total, total)."""
+        progress = []
+        client = make_client(FakeService())
+
+        list(client.fetch_emails(
+            IDS, progress_callback=lambda done, total: progress.append((done, total))
+        ))
+
+        assert progress[-1] == (len(IDS), len(IDS))
+        assert [done for done, _ in progress] == sorted(done for done, _ in progress)
+
+    def test_empty_input(self):
+        """No IDs yields nothing and sends no requests."""
+        service = FakeService()
+        assert list(make_client(service).fetch_emails([])) == []
+        assert service.batch_executions == 0
+
+    def test_batch_size_capped(self):
+        """A batch never carries more than MAX_BATCH_REQUESTS messages."""
+        service = FakeService()
+        ids = [f"m{n}" for n in range(GmailClient.MAX_BATCH_REQUESTS + 1)]
+
+        emails = list(make_client(service, batch_size=1000).fetch_emails(ids))
+
+        assert [email.id for email in emails] == ids
+        assert service.batch_executions == 2
+
+
+# =============================================================================
+# Failure and Retry Tests
+# =============================================================================
+
+class TestFetchFailures:
+    """Tests for messages and batches that fail."""
+
+    def test_failed_message_dropped(self):
+        """A message failing with a non-429 error is skipped, not yielded."""
+        service = FakeService(outcomes={"m04": [404], "m11": [500]})
+
+        emails = list(make_client(service).fetch_emails(IDS))
+
+        assert [email.id for email in emails] == [i for i in IDS if i not in ("m04", "m11")]
+        assert service.requested.count(("m04", "full")) == 1
+
+    def test_rate_limited_message_refetched(self):
+        """A message rate limited inside a batch is requested again and yielded in place."""
+        service = FakeService(outcomes={"m07": [429, 429]})
+
+        emails = list(make_client(service).fetch_emails(IDS))
+
+        assert [email.id for email in emails] == IDS
+        assert service.requested.count(("m07", "full")) == 3
+        # Only the rate-limited message is requested again
+        assert service.requested.count(("m06", "full")) == 1
+
+    def test_rate_limited_message_dropped_after_retries(self):
+        """A message still rate limited after MAX_RETRIES retries is skipped."""
+        service = FakeService(outcomes={"m07": [429] * (GmailClient.MAX_RETRIES + 1)})
+
+        emails = list(make_client(service).fetch_emails(IDS))
+
+        assert "m07" not in [email.id for email in emails]
+        assert len(emails) == len(IDS) - 1
+        assert service.requested.count(("m07", "full")) == GmailClient.MAX_RETRIES + 1
+
+    def test_batch_429_retried(self):
+        """A whole batch rejected with 429 is retried and its emails yielded."""
+        service = FakeService(batch_errors=[429, 429])
+
+        emails = list(make_client(service, max_workers=1).fetch_emails(IDS))
+
+        assert [email.id for email in emails] == IDS
+
+    def test_batch_failure_skips_chunk(self):
+        """A batch failing with another error drops its chunk only."""
+        service = FakeService(batch_errors=[500])
+
+        emails = list(make_client(service, batch_size=5, max_workers=1).fetch_emails(IDS))
+
+        assert [email.id for email in emails] == IDS[5:]
+
+
+# =============================================================================
+# Cache Tests
+# =============================================================================
+
+class TestFetchWithCache:
+    """Tests for fetching with an email cache."""
+
+    def test_cached_messages_fetched_minimal(self):
+        """Cached messages request labels only and keep cached content."""
+        content = CachedContent(
+            subject="Cached subject",
+            sender="cached@example.com",
+            body="Cached body",
+            snippet="",
+            date=None,
+            has_attachments=False,
+        )
+        cache = FakeCache({"m02": content})
+        service = FakeService()
+
+        emails = list(make_client(service, cache=cache).fetch_emails(IDS[:5]))
+
+        assert [email.id for email in emails] == IDS[:5]
+        assert emails[2].subject == "Cached subject"
+        assert emails[2].labels == ["INBOX"]
+        assert ("m02", "minimal") in service.requested
+        assert ("m02", "full") not in service.requested
+
+    def test_fetched_messages_stored(self):
+        """Newly fetched messages are added to the cache."""
+        cache = FakeCache()
+
+        list(make_client(FakeService(), cache=cache).fetch_emails(IDS[:5]))
+
+        assert sorted(cache.entries) == IDS[:5]
+        assert cache.entries["m00"].body == "Body of m00"
+
+
+# =============================================================================
+# HTTP Client Tests
+# =============================================================================
+
+class TestThreadHttp:
+    """Tests for the HTTP clients batch requests are sent over."""
+
+    def test_client_per_thread(self):
+        """Each thread gets its own client built from the given credentials."""
+        client = make_client(FakeService(), max_workers=2)
+        barrier = threading.Barrier(2)
+
+        def thread_clients(_):
+            barrier.wait()
+            return client._thread_http(), client._thread_http()
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            (first, first_again), (second, _) = executor.map(thread_clients, range(2))
+
+        assert first is first_again
+        assert first is not second
+        assert first.credentials is CREDENTIALS
+        assert second.credentials is CREDENTIALS
+
+    def test_no_credentials_single_worker(self):
+        """Without credentials the client uses one worker and the shared client."""
+        client = GmailClient(FakeService(), requests_per_second=0, max_workers=8)
+
+        assert client.max_workers == 1
+        assert client._thread_http() is None
+
+    def test_no_credentials_still_fetches(self):
+        """A client without credentials fetches everything in order."""
+        client = GmailClient(FakeService(), batch_size=3, requests_per_second=0, max_workers=8)
+
+        assert [email.id for email in client.fetch_emails(IDS)] == IDS
+
+    def test_modify_fallback_uses_thread_client(self, monkeypatch):
+        """Per-message trash batches are sent over the thread's own client."""
+        service = FakeService(modify_errors=[500])
+        client = make_client(service)
+        sent_over = []
+        execute = FakeBatch.execute
+
+        def record_http(batch, http=None):
+            sent_over.append(http)
+            execute(batch, http)
+
+        monkeypatch.setattr(FakeBatch, "execute", record_http)
+        client.trash_emails_batch(IDS[:3], delay=0)
+
+        assert sent_over == [client._thread_http()]
+        assert sent_over[0].credentials is CREDENTIALS
+
+
+# =============================================================================
+# Trash and Restore Tests
+# =============================================================================
+
+class TestRelabelEmails:
+    """Tests for trash_emails_batch() and untrash_emails_batch()."""
+
+    def test_chunked_at_max_modify_ids(self):
+        """Each batchModify call carries at most MAX_MODIFY_IDS IDs, in order."""
+        service = FakeService()
+        ids = [f"m{n}" for n in range(GmailClient.MAX_MODIFY_IDS * 2 + 5)]
+
+        result = make_client(service).trash_emails_batch(ids, delay=0)
+
+        assert result == (len(ids), [])
+        assert [len(call["ids"]) for call in service.modify_calls] == [
+            GmailClient.MAX_MODIFY_IDS, GmailClient.MAX_MODIFY_IDS, 5,
+        ]
+        assert [i for call in service.modify_calls for i in call["ids"]] == ids
+
+    def test_trash_adds_label(self):
+        """Trashing adds the TRASH label."""
+        service = FakeService()
+        make_client(service).trash_emails_batch(IDS[:3], delay=0)
+
+        assert service.modify_calls == [{"ids": IDS[:3], "addLabelIds": ["TRASH"]}]
+        assert service.requested == []
+
+    def test_untrash_removes_label(self):
+        """Restoring removes the TRASH label."""
+        service = FakeService()
+        make_client(service).untrash_emails_batch(IDS[:3])
+
+        assert service.modify_calls == [{"ids": IDS[:3], "removeLabelIds": ["TRASH"]}]
+
+    def test_batch_modify_429_retried(self):
+        """A batchModify call rejected with 429 is retried, not split up."""
+        service = FakeService(modify_errors=[429, 429])
+
+        result = make_client(service).trash_emails_batch(IDS, delay=0)
+
+        assert result == (len(IDS), [])
+        assert len(service.modify_calls) == 3
+        assert service.requested == []
+
+    def test_fallback_reports_only_failed(self):
+        """After batchModify fails, only messages whose own call failed are reported."""
+        service = FakeService(outcomes={"m03": [404], "m08": [500]}, modify_errors=[500])
+
+        result = make_client(service).trash_emails_batch(IDS, delay=0)
+
+        assert result == (len(IDS) - 2, ["m03", "m08"])
+        assert [email_id for email_id, _ in service.requested] == IDS
+        assert {method for _, method in service.requested} == {"trash"}
+
+    def test_fallback_uses_untrash(self):
+        """Restoring falls back to per-message untrash calls."""
+        service = FakeService(outcomes={"m01": [404]}, modify_errors=[500])
+
+        result = make_client(service).untrash_emails_batch(IDS[:4])
+
+        assert result == (3, ["m01"])
+        assert {method for _, method in service.requested} == {"untrash"}
+
+    def test_fallback_batch_429_retried(self):
+        """A fallback batch rejected with 429 is retried and its messages succeed."""
+        service = FakeService(modify_errors=[500], batch_errors=[429])
+
+        assert make_client(service).trash_emails_batch(IDS, delay=0) == (len(IDS), [])
+
+    def test_fallback_batch_failure_fails_sub_chunk(self):
+        """A fallback batch failing with another error reports its messages as failed."""
+        service = FakeService(modify_errors=[500], batch_errors=[500])
+
+        assert make_client(service).trash_emails_batch(IDS, delay=0) == (0, IDS)
+
+    def test_progress_reaches_total(self):
+        """The progress callback reports each chunk and ends at the total."""
+        progress = []
+        ids = [f"m{n}" for n in range(GmailClient.MAX_MODIFY_IDS + 5)]
+
+        make_client(FakeService()).trash_emails_batch(
+            ids, delay=0, progress_callback=lambda done, total: progress.append((done, total))
+        )
+
+        assert progress == [(GmailClient.MAX_MODIFY_IDS, len(ids)), (len(ids), len(ids))]
+
+
+# =============================================================================
+# HTML Stripping Tests
+# =============================================================================
+
+class TestStripScriptStyle:
+    """Tests for dropping script and style elements from HTML bodies."""
+
+    def test_elements_replaced(self):
+        """Script and style elements and their contents become a space."""
+        html = 'a<style>p { color: red }</style>b<SCRIPT type="x">run()</Script >c'
+        assert _strip_script_style(html) == "a b c"
+
+    def test_similar_tags_kept(self):
+        """Tags that only start like style, and lookalike end tags, are not elements' ends."""
+        assert _strip_script_style("<stylesheet>text") == "<stylesheet>text"
+        assert _strip_script_style("a<style>x</styles>y</style>b") == "a b"
+
+    def test_non_ascii_text(self):
+        """Offsets stay right around characters whose lowercase is longer."""
+        assert _strip_script_style("\u0130<style>x</STYLE>\u0130") == "\u0130 \u0130"
+
+    def test_unclosed_element_drops_rest(self):
+        """An element without an end tag runs to the end of the text."""
+        assert _strip_script_style("keep <script>var x = 1; <p>gone</p>") == "keep  "
+
+    def test_many_unclosed_tags_linear(self):
+        """Many unclosed start tags are handled in one pass, not one search each."""
+        html = "intro " + "<style>x " * 100_000
+
+        start = time.perf_counter()
+        result = _strip_script_style(html)
+
+        assert result == "intro  "
+        assert time.perf_counter() - start < 1.0
+
+    def test_body_fallback_strips(self):
+        """HTML-only messages have script and style stripped from the body."""
+        html = "<html><style>.a{}</style><p>Thanks for applying</p><script>x()"
+        msg = make_message("m00")
+        msg["payload"] = {
+            "mimeType": "multipart/alternative",
+            "headers": msg["payload"]["headers"],
+            "parts": [{
+                "mimeType": "text/html",
+                "body": {"data": base64.urlsafe_b64encode(html.encode()).decode()},
+            }],
+        }
+
+        body = make_client(FakeService())._parse_email(msg).body
+
+        assert "Thanks for applying" in body
+        assert ".a{}" not in body
+        assert "x()" not in body
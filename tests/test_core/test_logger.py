@@ -0,0 +1,106 @@
+"""
+Unit tests for the logger module.
+
+Tests cover:
+- Buffered main log file writes
+- Stopping the periodic flusher thread
+"""
+
+import itertools
+import time
+
+import pytest
+
+from core import logger as logger_module
+from core.logger import setup_logger
+
+
+_names = itertools.count()
+
+
+@pytest.fixture
+def log_setup(tmp_path, monkeypatch):
+    """Set up a file-only logger in tmp_path and tear it down afterwards."""
+    monkeypatch.setattr(logger_module, "_logger", None)
+
+    def setup():
+        monkeypatch.setattr(logger_module, "_logger", None)
+        return setup_logger(
+            name=f"emailagent-test-{next(_names)}",
+            level="DEBUG",
+            log_directory=tmp_path,
+            log_to_console=False,
+        )
+
+    yield setup
+    logger_module._stop_log_flusher()
+
+
+def log_text(tmp_path) -> str:
+    """Read everything written to the log files so far."""
+    return "".join(path.read_text() for path in tmp_path.glob("emailagent_*.log"))
+
+
+# =============================================================================
+# Buffering Tests
+# =============================================================================
+
+class TestLogBuffering:
+    """Tests for when records reach the log file."""
+
+    def test_error_written_immediately(self, log_setup, tmp_path):
+        """An ERROR record is written without waiting for a flush."""
+        logger = log_setup()
+        logger.info("before the error")
+        logger.error("something failed")
+
+        text = log_text(tmp_path)
+        assert "something failed" in text
+        assert "before the error" in text
+
+    def test_info_written_at_close(self, log_setup, tmp_path):
+        """INFO records stay buffered until the flusher is stopped."""
+        logger = log_setup()
+        logger.info("routine progress")
+        assert "routine progress" not in log_text(tmp_path)
+
+        logger_module._stop_log_flusher()
+        assert "routine progress" in log_text(tmp_path)
+
+    def test_info_written_periodically(self, log_setup, tmp_path, monkeypatch):
+        """Buffered records are written within the flush interval."""
+        monkeypatch.setattr(logger_module, "LOG_FLUSH_INTERVAL_SECONDS", 0.05)
+        logger = log_setup()
+        logger.info("eventually written")
+
+        deadline = time.monotonic() + 5
+        while "eventually written" not in log_text(tmp_path) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert "eventually written" in log_text(tmp_path)
+
+
+# =============================================================================
+# Flusher Tests
+# =============================================================================
+
+class TestLogFlusher:
+    """Tests for the periodic flusher thread."""
+
+    def test_second_setup_stops_previous_flusher(self, log_setup):
+        """Setting up again ends the earlier flusher thread."""
+        log_setup()
+        first = logger_module._log_flusher
+        assert first.is_alive()
+
+        log_setup()
+        assert not first.is_alive()
+        assert logger_module._log_flusher.is_alive()
+
+    def test_stop_is_idempotent(self, log_setup):
+        """Stopping twice, or with no logger set up, does nothing."""
+        log_setup()
+        logger_module._stop_log_flusher()
+        logger_module._stop_log_flusher()
+
+        assert logger_module._log_flusher is None
+        assert logger_module._log_buffer is None
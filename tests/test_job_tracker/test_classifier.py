@@ -21,9 +21,11 @@ from job_tracker.classifier import (
     validate_status,
     normalize_status,
     classify_email,
+    process_email,
     StatusUpdateResult,
 )
-from job_tracker.extractor import ExtractionResult, pattern_match_extraction
+from job_tracker.extractor import ExtractionResult, pattern_match_extraction, extract_email_info
+from job_tracker.job_patterns import required_literals
 
 
 # =============================================================================
@@ -248,6 +250,34 @@ class TestClassifyStatusOffer:
         assert count >= 2
 
 
+# =============================================================================
+# Literal Pre-filter Tests
+# =============================================================================
+
+class TestRequiredLiteral:
+    """Tests for the literal pre-check used before status regex searches."""
+
+    def test_skips_optional_prefix(self):
+        """Test literal comes from the required part of the pattern."""
+        assert required_literals(r'(?:we )?received your application') == (('received your application',),)
+
+    def test_alternation_of_literals(self):
+        """Test a top-level alternation requires one of its branches."""
+        assert required_literals(r'(?:technical|coding) (?:assessment|test)') == (
+            ('technical', 'coding'),
+            ('assessment', 'test'),
+        )
+
+    def test_no_literal_for_optional_alternation(self):
+        """Test optional groups and short branches add no requirement."""
+        assert required_literals(r'(?:please|kindly)? (?:a|an) call') == ((' call',),)
+
+    def test_dotless_i_still_matches(self):
+        """Test texts with case-folding extras fall back to plain regex search."""
+        status, count, patterns = classify_status('', 'We would like to ınvite you to an ınterview')
+        assert status == 'Interviewing'
+
+
 # =============================================================================
 # Status Hierarchy Tests
 # =============================================================================
@@ -468,6 +498,20 @@ class TestStatusValidation:
 class TestClassifyEmail:
     """Tests for the full email classification pipeline."""
 
+    def test_process_email_matches_two_step_pipeline(self):
+        """Test process_email gives the same result as extract + classify."""
+        email = {
+            'id': 'msg_789',
+            'from': 'recruiting@acme.com',
+            'subject': 'Interview invitation',
+            'body': 'We would like to schedule a phone screen for the Software Engineer role.',
+            'date': datetime(2026, 1, 25)
+        }
+
+        expected = classify_email(extract_email_info(email), email)
+
+        assert process_email(email).to_dict() == expected.to_dict()
+
     def test_classify_applied_email(self):
         """Test classifying an Applied status email."""
         email = {
@@ -0,0 +1,102 @@
+"""
+Unit tests for the Excel storage module.
+
+Tests cover:
+- Read-only loading of an existing tracker
+- Read-only loading writing nothing when the file or sheet is missing
+"""
+
+import pytest
+from datetime import datetime
+from openpyxl import Workbook
+
+from job_tracker.excel_storage import SHEET_NAME, ExcelStorage
+from job_tracker.extractor import ExtractionResult
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return tmp_path / "job_applications.xlsx", tmp_path / "backups"
+
+
+def make_storage(paths) -> ExcelStorage:
+    """Build storage for the fixture paths."""
+    file_path, backup_dir = paths
+    return ExcelStorage(str(file_path), backup_dir=str(backup_dir))
+
+
+def write_tracker(paths, companies) -> None:
+    """Create a tracker file holding one application per company."""
+    storage = make_storage(paths)
+    storage.initialize()
+    for n, company in enumerate(companies):
+        storage.add_or_update(ExtractionResult(
+            company=company,
+            position="Engineer",
+            status="Applied",
+            email_id=f"m{n}",
+            email_date=datetime(2024, 3, 1),
+        ))
+    storage.save()
+    storage.close()
+
+
+# =============================================================================
+# Read-Only Loading Tests
+# =============================================================================
+
+class TestReadOnlyInitialize:
+    """Tests for initialize(read_only=True)."""
+
+    def test_reads_existing_applications(self, paths):
+        """Applications in an existing file are read in sheet order."""
+        write_tracker(paths, ["Acme", "Globex"])
+
+        storage = make_storage(paths)
+        storage.initialize(read_only=True)
+
+        assert [app.company for app in storage.iter_applications()] == ["Acme", "Globex"]
+        assert storage.get_statistics()["total_companies"] == 2
+        storage.close()
+
+    def test_makes_no_backup(self, paths):
+        """Loading an existing file read-only creates no backup directory."""
+        write_tracker(paths, ["Acme"])
+        _, backup_dir = paths
+        for backup in backup_dir.glob("*"):
+            backup.unlink()
+        backup_dir.rmdir()
+
+        storage = make_storage(paths)
+        storage.initialize(read_only=True)
+        storage.close()
+
+        assert not backup_dir.exists()
+
+    def test_missing_file_raises(self, paths):
+        """A missing file raises FileNotFoundError and nothing is created."""
+        file_path, backup_dir = paths
+        storage = make_storage(paths)
+
+        with pytest.raises(FileNotFoundError):
+            storage.initialize(read_only=True)
+
+        assert not file_path.exists()
+        assert not backup_dir.exists()
+
+    def test_missing_sheet_reads_empty(self, paths):
+        """A file without the Applications sheet reads as empty and is left untouched."""
+        file_path, backup_dir = paths
+        workbook = Workbook()
+        workbook.active.title = "Other"
+        workbook.save(file_path)
+        before = file_path.read_bytes()
+
+        storage = make_storage(paths)
+        storage.initialize(read_only=True)
+
+        assert storage.worksheet.title == SHEET_NAME
+        assert storage.get_all_applications() == []
+        storage.close()
+        assert file_path.read_bytes() == before
+        assert not backup_dir.exists()